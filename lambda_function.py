@@ -1,9 +1,9 @@
-import json
+import orjson
 import os
 from sys import exc_info
 from typing import Dict, Any
 
-from utils.logger import get_logger, MetricsLogger
+from utils.logger import get_logger, flush_logs, MetricsLogger
 from scrapers import get_scraper
 
 logger = get_logger("price-tracker-scraper")
@@ -22,7 +22,7 @@ def lambda_handler(event, context):
     }
     """
     logger.info("Price tracker scraper started")
-    logger.info(f"Event: {json.dumps(event)}")
+    logger.info("Event: %s", event)
 
     metrics.record("execution_id", context.aws_request_id)
     metrics.record("function_name", context.function_name)
@@ -36,19 +36,22 @@ def lambda_handler(event, context):
         # Default response for scheduled events
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'message': 'Price tracker scraper executed successfully',
                 'timestamp': context.aws_request_id
-            })
+            }).decode()
         }
     except Exception as e:
-        logger.error(f"Error in lambda handler: {str(e)}", exc_info=True)
+        logger.error("Error in lambda handler: %s", e, exc_info=True)
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': str(e)
-            })
+            }).decode()
         }
+    finally:
+        # Logs are written by a background thread; don't leave any queued when frozen
+        flush_logs()
 
 def handle_test_scraper(event: Dict[str, Any], context) -> Dict[str, Any]:
     """
@@ -68,12 +71,12 @@ def handle_test_scraper(event: Dict[str, Any], context) -> Dict[str, Any]:
     if not url:
         return {
             'statusCode': 400,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': 'Missing required parameter: url'
-            })
+            }).decode()
         }
     
-    logger.info(f"Testing {store} scraper with URL: {url}")
+    logger.info("Testing %s scraper with URL: %s", store, url)
 
     try:
         # Get the appropriate scraper
@@ -99,28 +102,28 @@ def handle_test_scraper(event: Dict[str, Any], context) -> Dict[str, Any]:
             'discount_percentage': result.discount_percentage,
         }
         
-        logger.info(f"Scraping completed: {result_dict}")
+        logger.info("Scraping completed: %s", result_dict)
         
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'message': 'Scraping completed successfully',
                 'result': result_dict
-            })
+            }).decode()
         }
     except ValueError as e:
-        logger.error(f"Invalid store: {str(e)}")
+        logger.error("Invalid store: %s", e)
         return {
             'statusCode': 400,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': str(e)
-            })
+            }).decode()
         }
     except Exception as e:
-        logger.error(f"Scraping failed: {str(e)}", exc_info=True)
+        logger.error("Scraping failed: %s", e, exc_info=True)
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': str(e)
-            })
+            }).decode()
         }
\ No newline at end of file
@@ -1,36 +1,58 @@
 """
 Scraper factory for creating site-specific scrapers.
+
+Scraper modules (and the HTTP/parsing libraries they pull in) are imported on
+first use, so code paths that never scrape don't pay for them at cold start.
 """
 
-from scrapers.base import BaseScraper
-from scrapers.mercadolivre import MercadoLivreScraper
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scrapers.base import BaseScraper
+    from scrapers.mercadolivre import MercadoLivreScraper
+
+# Store identifier -> (module, class name)
+_SCRAPERS = {
+    'mercadolivre': ('scrapers.mercadolivre', 'MercadoLivreScraper'),
+    'mercado_livre': ('scrapers.mercadolivre', 'MercadoLivreScraper'), # Alternative naming
+}
 
-def get_scraper(store: str) -> BaseScraper:
+# Public names resolved lazily by __getattr__
+_LAZY_ATTRIBUTES = {
+    'BaseScraper': 'scrapers.base',
+    'MercadoLivreScraper': 'scrapers.mercadolivre',
+}
+
+def get_scraper(store: str) -> 'BaseScraper':
     """
     Factory function to get the appropriate scraper for a given store.
-    
+
     Args:
         store: Store identifier (e.g., 'mercadolivre', 'amazon_br')
-    
+
     Returns:
         Instance of the appropriate scraper class
-    
+
     Raises:
         ValueError: If store is not supported
     """
-    scrapers = {
-        'mercadolivre': MercadoLivreScraper,
-        'mercado_livre': MercadoLivreScraper, # Alternative naming
-    }
-
-    scraper_class = scrapers.get(store.lower())
+    target = _SCRAPERS.get(store.lower())
 
-    if not scraper_class:
+    if not target:
         raise ValueError(
             f"Unsupported store: {store}. "
-            f"Supported stores: {', '.join(scrapers.keys())}"
+            f"Supported stores: {', '.join(_SCRAPERS.keys())}"
         )
-    
+
+    module_name, class_name = target
+    scraper_class = getattr(import_module(module_name), class_name)
     return scraper_class()
 
-__all__ = ['BaseScraper', 'MercadoLivreScraper', 'get_scraper']
\ No newline at end of file
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
+
+__all__ = ['BaseScraper', 'MercadoLivreScraper', 'get_scraper']
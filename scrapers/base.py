@@ -3,20 +3,265 @@ Base scraper class providing common functionality for all site-specific scrapers
 """
 import re
 import time
+import asyncio
 import logging
 import gzip
+import random
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+import ahocorasick
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Price parsing patterns, compiled once at import time
+_PREFIX_RE = re.compile(
+    r'(was|now|from|starting at|de|por|a partir de|por apenas)[\s:]*',
+    re.IGNORECASE
+)
+# Leftmost price-like token; the named group tells which currency branch matched
+_PRICE_RE = re.compile(
+    r'R\$?\s*(?P<brl>\d+(?:[\s\.,]\d{3})*(?:[,\.]\d{2}))'  # Brazilian Real with R$
+    r'|\$\s*(?P<usd>\d+(?:[,\.]\d{3})*(?:[,\.]\d{2}))'     # Dollar sign
+    r'|€\s*(?P<eur>\d+(?:[,\.]\d{3})*(?:[,\.]\d{2}))'       # Euro sign
+    r'|(?P<num>\d+(?:[\s\.,]\d{3})*(?:[,\.]\d{2}))'         # Any number format
+)
+_DEC_COMMA_RE = re.compile(r'\d+,\d{2}$')
+_DEC_DOT_RE = re.compile(r'\d+\.\d{2}$')
+
+_PLAIN_PRICE_CHARS = frozenset('0123456789., ')
+
+def _parse_plain_price(price_text: str) -> Optional[float]:
+    """
+    Parse a bare Brazilian-style number without regular expressions.
+
+    Handles what the Andes price components render: "1299", "1.299",
+    "1.299,90", "1 299,90", "79,99" and "1.29"-style dot decimals. Dots or
+    spaces must group thousands in threes after a 1-3 digit leading group,
+    and a comma must be followed by exactly two cents digits. Anything else
+    is left to the regex parser.
+
+    Args:
+        price_text: Text made only of digits, dots, commas and spaces
+
+    Returns:
+        Parsed number, or None if the text is not in that canonical form
+    """
+    integer, comma, cents = price_text.partition(',')
+    if comma:
+        if len(cents) != 2 or not cents.isdigit():
+            return None
+    elif integer.count('.') == 1 and len(integer) - integer.index('.') == 3:
+        # Dot followed by exactly two digits is a decimal point
+        integer, _, cents = integer.partition('.')
+        if not cents.isdigit():
+            return None
+
+    # Thousands are grouped by dots or by spaces, never both: "1.299", "1 299"
+    if '.' in integer and ' ' in integer:
+        return None
+    groups = integer.split('.' if '.' in integer else ' ')
+    if not all(group.isdigit() for group in groups):
+        return None
+    if len(groups) > 1:
+        first = groups[0]
+        if len(first) > 3 or first[0] == '0':
+            return None
+        if any(len(group) != 3 for group in groups[1:]):
+            return None
+
+    return float(f"{''.join(groups)}.{cents or '0'}")
+
+# "price" of a schema.org offer in JSON-LD, as a number or numeric string
+_JSONLD_PRICE_RE = re.compile(r'"price"\s*:\s*"?(\d+(?:\.\d+)?)')
+
+# Currency tokens mapped to (priority, code). Explicit codes come first,
+# then symbols; R$, C$ and A$ must outrank the bare $.
+CURRENCY_TOKENS = {
+    token: (rank, code)
+    for rank, (token, code) in enumerate([
+        ('BRL', 'BRL'),
+        ('USD', 'USD'),
+        ('EUR', 'EUR'),
+        ('GBP', 'GBP'),
+        ('JPY', 'JPY'),
+        ('CAD', 'CAD'),
+        ('AUD', 'AUD'),
+        ('R$', 'BRL'),
+        ('C$', 'CAD'),
+        ('A$', 'AUD'),
+        ('$', 'USD'),
+        ('€', 'EUR'),
+        ('£', 'GBP'),
+        ('¥', 'JPY'),
+    ])
+}
+_CURRENCY_RE = re.compile('|'.join(re.escape(token) for token in CURRENCY_TOKENS))
+
+# Only the head of the page is sniffed for currency markers
+_CURRENCY_SAMPLE_CHARS = 5000
+
+
+def _pick_currency(tokens, default: str) -> str:
+    """
+    Pick the highest-priority currency among the tokens found on a page.
+
+    Explicit codes beat symbols, and tokens keep the priority of
+    CURRENCY_TOKENS regardless of where they appear.
+    """
+    best_rank = None
+    currency = default
+    for token in tokens:
+        rank, code = CURRENCY_TOKENS[token]
+        if best_rank is None or rank < best_rank:
+            best_rank, currency = rank, code
+            if rank == 0:
+                break
+    return currency
+
+# Recent desktop browser user agents, rotated per request
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
+)
+
+# Browser-like headers sent with every request (User-Agent is set per request)
+_DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+}
+
+# Bytes read per iteration when streaming a page
+_STREAM_CHUNK_SIZE = 16 * 1024
+
+_CLIENT_OPTIONS = {
+    'http2': True,
+    'timeout': 30.0,
+    'follow_redirects': True,
+    'limits': httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    'headers': _DEFAULT_HEADERS,
+}
+
+# Module-level HTTP client (persists across Lambda invocations)
+_SHARED_CLIENT = httpx.Client(**_CLIENT_OPTIONS)
+
+# Lowercase phrases indicating a product cannot be bought
+UNAVAILABLE_PHRASES = (
+    # English phrases
+    'out of stock',
+    'currently unavailable',
+    'not available',
+    'sold out',
+    'no longer available',
+    'discontinued',
+    # Portuguese phrases (Brazilian)
+    'indisponível',
+    'esgotado',
+    'fora de estoque',
+    'produto indisponível',
+    'sem estoque',
+    'temporariamente indisponível',
+    'não disponível',
+    'produto esgotado',
+    'estoque esgotado',
+    'fora de linha',
+    'descontinuado',
+)
+
+class PhraseMatcher:
+    """
+    Case-insensitive search for any of a set of phrases in large text.
+
+    Phrases are compiled into an Aho-Corasick automaton, so the text is scanned
+    in a single linear pass instead of once per phrase. The text is lowercased
+    in fixed-size windows rather than all at once, which keeps memory flat for
+    multi-hundred-KB pages.
+
+    Optional case-sensitive tokens (e.g. currency markers) get their own
+    automaton, run over the original text: lowercasing can change the length
+    of the text ('İ' becomes two characters), so offsets into the lowercased
+    text can't be mapped back to it.
+    """
+
+    # Characters lowercased and scanned at a time
+    WINDOW_SIZE = 64 * 1024
+
+    def __init__(self, phrases, tokens=()):
+        """
+        Compile the phrases and tokens.
+
+        Args:
+            phrases: Lowercase phrases to search for
+            tokens: Case-sensitive tokens reported by scan()
+        """
+        self._automaton = ahocorasick.Automaton()
+        for phrase in phrases:
+            self._automaton.add_word(phrase, phrase)
+        self._automaton.make_automaton()
+        self._tokens = None
+        if tokens:
+            self._tokens = ahocorasick.Automaton()
+            for token in tokens:
+                self._tokens.add_word(token, token)
+            self._tokens.make_automaton()
+        # Windows overlap so phrases spanning a boundary are still found
+        self._overlap = max(len(phrase) for phrase in phrases) - 1
+
+    def search(self, text: str, start: int = 0) -> bool:
+        """
+        Check whether any phrase occurs in the text, stopping at the first match.
+
+        Args:
+            text: Text to scan, in any case
+            start: Offset to start scanning from
+
+        Returns:
+            True if at least one phrase was found
+        """
+        for window_start in range(start, len(text), self.WINDOW_SIZE):
+            window_from = max(start, window_start - self._overlap)
+            window = text[window_from:window_start + self.WINDOW_SIZE].lower()
+            if next(self._automaton.iter(window), None) is not None:
+                return True
+        return False
+
+    def scan(self, text: str, token_limit: int) -> Tuple[bool, List[str]]:
+        """
+        Search for the phrases and collect tokens from the head of the text.
+
+        Tokens are collected from the first token_limit characters, as they
+        appear in the original text; the whole text is searched for phrases,
+        stopping at the first one.
+
+        Args:
+            text: Text to scan, in any case
+            token_limit: Number of leading characters to collect tokens from
+
+        Returns:
+            Tuple of (whether a phrase was found, tokens in order of appearance)
+        """
+        tokens = []
+        if self._tokens is not None:
+            tokens = [token for _, token in self._tokens.iter(text[:token_limit])]
+        return self.search(text), tokens
+
 @dataclass
 class ScrapingResult:
     """
@@ -46,6 +291,20 @@ class BaseScraper(ABC):
     Provides common functionality for HTTP requests, HTML parsing, and price extraction.
     """
 
+    # Source recorded on results and currency assumed when a page has none.
+    # Overridden by each site-specific scraper.
+    scrape_source = 'unknown'
+    default_currency = 'BRL'
+
+    # Pages are streamed and cut off at this size, bounding memory and transfer
+    max_html_bytes = 2 * 1024 * 1024
+
+    # Total seconds one URL may spend in fetch_html, retries and backoff included,
+    # so a rate-limited page can't hold up a batch indefinitely
+    max_fetch_seconds = 60
+
+    _unavailable_matcher = PhraseMatcher(UNAVAILABLE_PHRASES, tokens=CURRENCY_TOKENS)
+
     def __init__(self, timeout: int = 30, max_retries: int = 3):
         """
         Initialize the base scraper.
@@ -57,29 +316,19 @@ class BaseScraper(ABC):
         self.timeout = timeout
         self.max_retries = max_retries
         self.session = self._create_session()
-        self.ua = UserAgent()
     
-    def _create_session(self) -> requests.Session:
+    def _create_session(self) -> httpx.Client:
         """
-        Create and configure an HTTP session with appropriate headers.
+        Get the HTTP client used for fetching pages.
+
+        Lambda functions reuse execution environments, so all scrapers share a
+        module-level client whose keep-alive connections survive across
+        invocations. Warm invocations skip the TCP and TLS handshakes.
 
         Returns:
-            Configured requests.Session object
-        """
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': self._get_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0',
-        })
-        return session
+            Shared httpx.Client object
+        """
+        return _SHARED_CLIENT
     
     def _get_user_agent(self) -> str:
         """
@@ -88,11 +337,7 @@ class BaseScraper(ABC):
         Returns:
             User agent string
         """
-        try:
-            return self.ua.random
-        except Exception:
-            # Fallback to a default user agent if fake_useragent fails
-            return 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+        return random.choice(_USER_AGENTS)
 
     def fetch_html(self, url: str) -> Optional[str]:
         """
@@ -104,81 +349,305 @@ class BaseScraper(ABC):
         Returns:
             HTML content as string, or None if failed
         """
+        deadline = time.monotonic() + self.max_fetch_seconds
+
+        attempts = 0
         for attempt in range(self.max_retries):
+            attempts = attempt + 1
             try:
+                start_time = time.monotonic()
                 # Rotate user agent on each attempt
-                self.session.headers['User-Agent'] = self._get_user_agent()
-
-                start_time = time.time()
-                response = self.session.get(url, timeout=self.timeout)
-                response_time = int((time.time() - start_time) * 1000)
-
-                response.raise_for_status()
-
-                logger.info(f"Successfully fetched {url} in {response_time}ms (attempt {attempt + 1})")
-
-                content = response.content
-                if content.startswith(b'\x1f\x8b'):
-                    try:
-                        logger.debug(f"Detected raw GZIP content for {url}, decompressing manually")
-                        content = gzip.decompress(content)
-                        encoding = response.encoding or response.apparent_encoding or 'utf-8' 
-                        return content.decode(encoding, errors='replace')
-                    except Exception as e:
-                        logger.warning(f"Manual GZIP decompression failed: {e}")
-                return response.text
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout fetching {url} (attempt {attempt + 1}/{self.max_retries})")
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 429: # Rate limited
-                    wait_time = 2 ** attempt # Exponential backoff
-                    logger.warning(f"Rate limited on {url}, waiting {wait_time}s")
-                    time.sleep(wait_time)
-                elif e.response.status_code in [404, 410]: # Product nof found or gone
-                    logger.error(f"Product not found at {url}: {e.response.status_code}")
+                with self.session.stream(
+                    'GET',
+                    url,
+                    headers={'User-Agent': self._get_user_agent()},
+                    timeout=self._remaining_timeout(deadline)
+                ) as response:
+                    response.raise_for_status()
+                    body = bytearray()
+                    for chunk in response.iter_bytes(_STREAM_CHUNK_SIZE):
+                        body += chunk
+                        if len(body) >= self.max_html_bytes:
+                            break
+                    return self._decode_response(url, response, body, start_time, attempt)
+            except httpx.HTTPError as e:
+                wait_time = self._get_retry_delay(url, e, attempt)
+                if wait_time is None:
                     return None
-                else:
-                    logger.error(f"HTTP error fetching {url}: {e}")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed for {url}: {e}")
-            
-            # Wait before retry (except on last attempt)
-            if attempt < self.max_retries - 1:
-                time.sleep(1 * (attempt + 1)) # Progressive delay
+
+            if wait_time:
+                if time.monotonic() + wait_time >= deadline:
+                    break
+                time.sleep(wait_time)
             
-        logger.error(f"Failed to fetch {url} after {self.max_retries} attempts")
+        logger.error("Failed to fetch %s after %d attempts", url, attempts)
         return None
-    
-    @abstractmethod
+
+    async def _fetch_html_async(self, client: httpx.AsyncClient, url: str) -> Optional[str]:
+        """
+        Fetch HTML content from a URL with retry logic, without blocking the event loop.
+
+        Args:
+            client: Async HTTP client shared by the current batch
+            url: The URL to fetch
+
+        Returns:
+            HTML content as string, or None if failed
+        """
+        deadline = time.monotonic() + self.max_fetch_seconds
+
+        attempts = 0
+        for attempt in range(self.max_retries):
+            attempts = attempt + 1
+            try:
+                start_time = time.monotonic()
+                async with client.stream(
+                    'GET',
+                    url,
+                    headers={'User-Agent': self._get_user_agent()},
+                    timeout=self._remaining_timeout(deadline)
+                ) as response:
+                    response.raise_for_status()
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                        body += chunk
+                        if len(body) >= self.max_html_bytes:
+                            break
+                    return self._decode_response(url, response, body, start_time, attempt)
+            except httpx.HTTPError as e:
+                wait_time = self._get_retry_delay(url, e, attempt)
+                if wait_time is None:
+                    return None
+
+            if wait_time:
+                if time.monotonic() + wait_time >= deadline:
+                    break
+                await asyncio.sleep(wait_time)
+
+        logger.error("Failed to fetch %s after %d attempts", url, attempts)
+        return None
+
+    def _remaining_timeout(self, deadline: float) -> float:
+        """Request timeout for the next attempt, capped by what is left of the fetch budget."""
+        return max(1.0, min(self.timeout, deadline - time.monotonic()))
+
+    def _decode_response(
+        self,
+        url: str,
+        response: httpx.Response,
+        body: bytes,
+        start_time: float,
+        attempt: int
+    ) -> str:
+        """
+        Decode the streamed body of a successful response.
+
+        Args:
+            url: The URL that was fetched
+            response: Successful HTTP response
+            body: Bytes read from the response, at most max_html_bytes
+            start_time: time.monotonic() when the request was sent
+            attempt: Zero-based attempt number
+
+        Returns:
+            HTML content as string
+        """
+        response_time = int((time.monotonic() - start_time) * 1000)
+        logger.info("Successfully fetched %s in %dms (attempt %d)", url, response_time, attempt + 1)
+
+        if len(body) >= self.max_html_bytes:
+            logger.warning("Page at %s exceeds %d bytes, truncated", url, self.max_html_bytes)
+
+        content = bytes(body)
+        encoding = response.encoding or 'utf-8'
+        # httpx already decodes declared encodings; only undeclared raw GZIP needs this
+        if 'Content-Encoding' not in response.headers and content.startswith(b'\x1f\x8b'):
+            try:
+                logger.debug("Detected raw GZIP content for %s, decompressing manually", url)
+                content = gzip.decompress(content)
+            except Exception as e:
+                logger.warning("Manual GZIP decompression failed: %s", e)
+        return content.decode(encoding, errors='replace')
+
+    def _get_retry_delay(self, url: str, error: httpx.HTTPError, attempt: int) -> Optional[float]:
+        """
+        Log a failed fetch attempt and decide how long to wait before the next one.
+
+        Args:
+            url: The URL being fetched
+            error: Error raised by the attempt
+            attempt: Zero-based attempt number
+
+        Returns:
+            Seconds to wait before retrying, or None if the URL should not be retried
+        """
+        wait_time = 0
+        if isinstance(error, httpx.TimeoutException):
+            logger.warning("Timeout fetching %s (attempt %d/%d)", url, attempt + 1, self.max_retries)
+        elif isinstance(error, httpx.HTTPStatusError):
+            if error.response.status_code == 429: # Rate limited
+                wait_time = 2 ** attempt # Exponential backoff
+                logger.warning("Rate limited on %s, waiting %ss", url, wait_time)
+            elif error.response.status_code in [404, 410]: # Product nof found or gone
+                logger.error("Product not found at %s: %d", url, error.response.status_code)
+                return None
+            else:
+                logger.error("HTTP error fetching %s: %s", url, error)
+        else:
+            logger.error("Request failed for %s: %s", url, error)
+
+        # No point waiting after the last attempt
+        if attempt >= self.max_retries - 1:
+            return 0
+        return wait_time + 1 * (attempt + 1) # Progressive delay
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        """
+        Create an async HTTP client for a batch of concurrent fetches.
+
+        Async clients are bound to the event loop they run on, so a new one is
+        created for each batch rather than shared across invocations.
+
+        Returns:
+            Configured httpx.AsyncClient object
+        """
+        return httpx.AsyncClient(**_CLIENT_OPTIONS)
+
     def scrape_price(self, url: str, product_link_id: str) -> ScrapingResult:
         """
-        Abstract method to scrape price from a specific e-commerce site.
-        Must be implemented by each site-specific scraper.
+        Scrape price and availability from a product page.
+
+        Args:
+            url: Product URL to scrape
+            product_link_id: Database ID of the product link
+
+        Returns:
+            ScrapingResult object with price data and metadata
+        """
+        start_time = time.monotonic()
+
+        try:
+            html = self.fetch_html(url)
+            return self._build_result(url, product_link_id, html, start_time)
+        except Exception as e:
+            logger.error("Error scraping %s product %s: %s", self.scrape_source, url, e)
+            return self._failed_result(url, product_link_id, start_time, str(e))
+
+    async def scrape_prices(self, links: List[Tuple[str, str]]) -> List[ScrapingResult]:
+        """
+        Scrape several product pages concurrently.
+
+        Pages are fetched in parallel over one async client, so the batch
+        takes about as long as its slowest page rather than the sum of all.
+
+        Args:
+            links: (url, product_link_id) pairs to scrape
+
+        Returns:
+            ScrapingResult objects in the same order as links
+        """
+        async with self._create_async_client() as client:
+            return await asyncio.gather(*(
+                self._scrape_one_async(client, url, product_link_id)
+                for url, product_link_id in links
+            ))
+
+    async def _scrape_one_async(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        product_link_id: str
+    ) -> ScrapingResult:
+        """
+        Scrape a single product page as part of a concurrent batch.
 
         Args:
+            client: Async HTTP client shared by the current batch
             url: Product URL to scrape
             product_link_id: Database ID of the product link
 
+        Returns:
+            ScrapingResult object with price data and metadata
+        """
+        start_time = time.monotonic()
+
+        try:
+            html = await self._fetch_html_async(client, url)
+            return self._build_result(url, product_link_id, html, start_time)
+        except Exception as e:
+            logger.error("Error scraping %s product %s: %s", self.scrape_source, url, e)
+            return self._failed_result(url, product_link_id, start_time, str(e))
+
+    def _build_result(
+        self,
+        url: str,
+        product_link_id: str,
+        html: Optional[str],
+        start_time: float
+    ) -> ScrapingResult:
+        """Build the result for a fetched page, or a failure if nothing was fetched."""
+        if not html:
+            return self._failed_result(url, product_link_id, start_time, 'Failed to fetch HTML')
+        return self.parse_page(html, url, product_link_id, start_time)
+
+    def _failed_result(
+        self,
+        url: str,
+        product_link_id: str,
+        start_time: float,
+        error: str
+    ) -> ScrapingResult:
+        """Build a result for a scrape that produced no price."""
+        return ScrapingResult(
+            product_link_id=product_link_id,
+            url=url,
+            price=None,
+            original_price=None,
+            currency=self.default_currency,
+            was_available=False,
+            scrape_source=self.scrape_source,
+            response_time_ms=int((time.monotonic() - start_time) * 1000),
+            error=error
+        )
+
+    @abstractmethod
+    def parse_page(
+        self,
+        html: str,
+        url: str,
+        product_link_id: str,
+        start_time: float
+    ) -> ScrapingResult:
+        """
+        Abstract method to extract price data from a fetched product page.
+        Must be implemented by each site-specific scraper.
+
+        Args:
+            html: HTML content of the product page
+            url: Product URL that was scraped
+            product_link_id: Database ID of the product link
+            start_time: time.monotonic() when the scrape started, for response_time_ms
+
         Returns:
             ScrapingResult object with price data and metadata
         """
         pass
 
     @abstractmethod
-    def get_price_selectors(self) -> List[str]:
+    def get_price_selectors(self) -> Sequence[str]:
         """
         Get CSS selectors for extracting price from HTML.
         Must be implemented by each site-specific scraper.
 
         Returns:
-            List of CSS selectors to try in order
+            Sequence of CSS selectors to try in order
         """
         pass
 
     def extract_price_from_html(
         self,
         html: str,
-        selectors: List[str]
+        selectors: Sequence[str]
     ) -> Optional[float]:
         """
         Extract price from HTML using multiple CSS selectors.
@@ -190,30 +659,88 @@ class BaseScraper(ABC):
         Returns:
             Extracted price as float, or None if not found
         """
-        soup = BeautifulSoup(html, 'lxml')
+        price = self.extract_price_fast(html)
+        if price:
+            logger.debug("Extracted price $%s from raw HTML without parsing", price)
+            return price
+
+        tree = LexborHTMLParser(html)
 
         for selector in selectors:
             try:
-                element = soup.select_one(selector)
+                element = tree.css_first(selector)
                 if element:
                     price_text = self._get_price_text(element)
                     price = self.parse_price_text(price_text)
                     if price:
-                        logger.debug(f"Extracted price ${price} using selector: {selector}")
+                        logger.debug("Extracted price $%s using selector: %s", price, selector)
                         return price
             except Exception as e:
-                logger.debug(f"Failed to extract price with selector '{selector}': {e}")
+                logger.debug("Failed to extract price with selector '%s': %s", selector, e)
                 continue
         
+        price = self.extract_price_jsonld(html)
+        if price:
+            logger.debug("Extracted price $%s from JSON-LD structured data", price)
+            return price
+
         logger.warning("Could not extract price using any selector")
         return None
     
+    def extract_price_fast(self, html: str) -> Optional[float]:
+        """
+        Try to read the price straight from the raw HTML, skipping DOM construction.
+        Can be overridden by site-specific scrapers whose main price markup is
+        regular enough to match with a regex.
+
+        Args:
+            html: HTML content to scan
+
+        Returns:
+            Extracted price as float, or None to fall back to the CSS selectors
+        """
+        return None
+
+    def extract_price_jsonld(self, html: str) -> Optional[float]:
+        """
+        Read the offer price from JSON-LD structured data with a regex,
+        without building a DOM tree or decoding the JSON.
+
+        Args:
+            html: HTML content to scan
+
+        Returns:
+            Extracted price as float, or None if no JSON-LD price is present
+        """
+        script = html.find('application/ld+json')
+        while script != -1:
+            # Only search inside this block, so a later inline script's
+            # "price" key is never mistaken for the offer price
+            end = html.find('</script>', script)
+            if end == -1:
+                end = len(html)
+
+            match = _JSONLD_PRICE_RE.search(html, script, end)
+            if match:
+                price = float(match.group(1))
+                return round(price, 2) if 0.01 <= price <= 10000000 else None
+
+            script = html.find('application/ld+json', end)
+
+        return None
+
     def _get_price_text(self, element) -> str:
         """
         Extract text from a price element.
         Can be overriden by subclasses to handle complex price structures.
+
+        Falls back to the ``content`` attribute for elements without text,
+        such as ``<meta property="og:price:amount">``.
         """
-        return element.get_text().strip()
+        text = element.text(strip=True)
+        if not text:
+            text = element.attributes.get('content') or ''
+        return text
     
     def parse_price_text(self, price_text: str) -> Optional[float]:
         """
@@ -226,6 +753,7 @@ class BaseScraper(ABC):
             "R$ 1 234,56" -> 1234.56 (Brazilian with space separator)
             "1234.56 USD" -> 1234.56
             "$1,234.56 - $2,000.00" -> 1234.56 (takes first price)
+            "1.299" -> 1299.0 (Brazilian thousands, no cents)
         
         Args:
             price_text: Raw price text from HTML
@@ -235,67 +763,61 @@ class BaseScraper(ABC):
         """
         if not price_text:
             return None
+
+        # Fast path for the bare digits sites like Mercado Livre render
+        if price_text[0].isdigit() and _PLAIN_PRICE_CHARS.issuperset(price_text):
+            price = _parse_plain_price(price_text)
+            if price is not None:
+                return round(price, 2) if 0.01 <= price <= 10000000 else None
         
         # Remove common text patterns (English and Portuguese)
-        price_text = re.sub(
-            r'(was|now|from|starting at|de|por|a partir de|por apenas)[\s:]*', 
-            '', 
-            price_text, 
-            flags=re.IGNORECASE
-        )
+        price_text = _PREFIX_RE.sub('', price_text)
 
         # Extract first price-like pattern (handles ranges like "$10 - $20" or "R$ 10 - R$ 20")
-        price_patterns = [
-            r'R\$?\s*(\d+(?:[\s\.,]\d{3})*(?:[,\.]\d{2}))',  # Brazilian Real with R$
-            r'\$\s*(\d+(?:[,\.]\d{3})*(?:[,\.]\d{2}))',      # Dollar sign
-            r'€\s*(\d+(?:[,\.]\d{3})*(?:[,\.]\d{2}))',       # Euro sign
-            r'(\d+(?:[\s\.,]\d{3})*(?:[,\.]\d{2}))',         # Any number format
-        ]
-
-        for pattern in price_patterns:
-            match = re.search(pattern, price_text)
-            if match:
-                price_str = match.group(1)
-                
-                # Remove spaces (Brazilian format: R$ 1 234,56)
-                price_str = price_str.replace(' ', '')
-                    
-                # Handle different decimal separators
-                # Brazilian/European format: 1.234,56 -> 1234.56
-                if ',' in price_str and '.' in price_str:
-                    if price_str.rindex(',') > price_str.rindex('.'):
-                        # Brazilian format: 1.234,56 or 1234,56
-                        price_str = price_str.replace('.', '').replace(',', '.')
-                    else:
-                        # US format: 1,234.56
-                        price_str = price_str.replace(',', '')
-                # Only comma present
-                elif ',' in price_str:
-                    # Check if comma is decimal separator (only 2 digits after)
-                    if re.match(r'\d+,\d{2}$', price_str):
-                        # Brazilian/European: 1234,56
-                        price_str = price_str.replace(',', '.')
-                    else:
-                        # Thousands separator: 1,234
-                        price_str = price_str.replace(',', '')
-                # Only dot present - could be thousands or decimal
-                elif '.' in price_str:
-                    # If only 2 digits after dot, it's decimal
-                    if re.match(r'\d+\.\d{2}$', price_str):
-                        pass  # Already in correct format
-                    else:
-                        # Thousands separator
-                        price_str = price_str.replace('.', '')
+        # A single scan yields candidates left to right; later ones are only
+        # tried if an earlier match fails to convert or is out of range
+        for match in _PRICE_RE.finditer(price_text):
+            price_str = match.group(match.lastgroup)
+            
+            # Remove spaces (Brazilian format: R$ 1 234,56)
+            price_str = price_str.replace(' ', '')
                 
-                try:
-                    price = float(price_str)
-                    # Sanity check: reasonable price range (R$ 0.01 to R$ 10 million)
-                    if 0.01 <= price <= 10000000:
-                        return round(price, 2)
-                except ValueError:
-                    continue
+            # Handle different decimal separators
+            # Brazilian/European format: 1.234,56 -> 1234.56
+            if ',' in price_str and '.' in price_str:
+                if price_str.rindex(',') > price_str.rindex('.'):
+                    # Brazilian format: 1.234,56 or 1234,56
+                    price_str = price_str.replace('.', '').replace(',', '.')
+                else:
+                    # US format: 1,234.56
+                    price_str = price_str.replace(',', '')
+            # Only comma present
+            elif ',' in price_str:
+                # Check if comma is decimal separator (only 2 digits after)
+                if _DEC_COMMA_RE.match(price_str):
+                    # Brazilian/European: 1234,56
+                    price_str = price_str.replace(',', '.')
+                else:
+                    # Thousands separator: 1,234
+                    price_str = price_str.replace(',', '')
+            # Only dot present - could be thousands or decimal
+            elif '.' in price_str:
+                # If only 2 digits after dot, it's decimal
+                if _DEC_DOT_RE.match(price_str):
+                    pass  # Already in correct format
+                else:
+                    # Thousands separator
+                    price_str = price_str.replace('.', '')
+            
+            try:
+                price = float(price_str)
+                # Sanity check: reasonable price range (R$ 0.01 to R$ 10 million)
+                if 0.01 <= price <= 10000000:
+                    return round(price, 2)
+            except ValueError:
+                continue
         
-        logger.debug(f"Could not parse price from text: {price_text}")
+        logger.debug("Could not parse price from text: %s", price_text)
         return None
     
     def extract_currency(self, html: str, default: str = 'BRL') -> str:
@@ -309,36 +831,32 @@ class BaseScraper(ABC):
         Returns:
             Currency code (e.g., 'BRL', 'USD', 'EUR', 'GBP')
         """
-        # Check first 5KB for performance
-        html_sample = html[:5000]
-        
-        # Check for explicit currency codes first
-        currency_codes = ['BRL', 'USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD']
-        for code in currency_codes:
-            if code in html_sample:
-                return code
-        
-        # Check currency symbols (order matters - check R$ before $)
-        currency_symbols = {
-            'R$': 'BRL',
-            'C$': 'CAD',
-            'A$': 'AUD',
-            '$': 'USD',
-            '€': 'EUR',
-            '£': 'GBP',
-            '¥': 'JPY',
-        }
-
-        for symbol, code in currency_symbols.items():
-            if symbol in html_sample:
-                return code
-        
-        return default
+        # Check first 5KB for performance, in a single scan
+        tokens = (match.group() for match in _CURRENCY_RE.finditer(html, 0, _CURRENCY_SAMPLE_CHARS))
+        return _pick_currency(tokens, default)
+
+    def scan_page(self, html: str, default_currency: str = 'BRL') -> Tuple[bool, str]:
+        """
+        Check availability and extract the currency in a single pass over the page.
+
+        Equivalent to calling is_product_available() and extract_currency(),
+        but the page is lowercased and scanned for phrases only once.
+
+        Args:
+            html: HTML content to check
+            default_currency: Default currency if not found
+
+        Returns:
+            Tuple of (is_available, currency code)
+        """
+        unavailable, tokens = self._unavailable_matcher.scan(html, _CURRENCY_SAMPLE_CHARS)
+        return not unavailable, _pick_currency(tokens, default_currency)
     
     def is_product_available(self, html: str) -> bool:
         """
         Check if product is available for purchase.
-        Can be overridden by site-specific scrapers.
+        Site-specific scrapers extend the phrase list by overriding
+        _unavailable_matcher.
 
         Args:
             html: HTML content to check
@@ -346,32 +864,12 @@ class BaseScraper(ABC):
         Returns:
             True if product appears to be available
         """
-        unavailable_phrases = [
-            # English phrases
-            'out of stock',
-            'currently unavailable',
-            'not available',
-            'sold out',
-            'no longer available',
-            'discontinued',
-            # Portuguese phrases (Brazilian)
-            'indisponível',
-            'esgotado',
-            'fora de estoque',
-            'produto indisponível',
-            'sem estoque',
-            'temporariamente indisponível',
-            'não disponível',
-            'produto esgotado',
-            'estoque esgotado',
-            'fora de linha',
-            'descontinuado',
-        ]
-
-        html_lower = html.lower()
-        return not any(phrase in html_lower for phrase in unavailable_phrases)
+        return not self._unavailable_matcher.search(html)
 
     def close(self):
-        """Close the HTTP session."""
-        if self.session:
-            self.session.close()
\ No newline at end of file
+        """
+        Release the scraper.
+
+        The shared HTTP client is intentionally left open so the next
+        invocation reuses its connection pool.
+        """
\ No newline at end of file
@@ -3,165 +3,174 @@ Mercado Livre scraper for Brazilian e-commerce products.
 Handles price extraction in Brazilian Real (R$) format.
 """
 import logging
-from typing import List, Optional
+import re
+from typing import Optional, Sequence
 import time
 
-from scrapers.base import BaseScraper, ScrapingResult
+from scrapers.base import (
+    BaseScraper,
+    ScrapingResult,
+    PhraseMatcher,
+    UNAVAILABLE_PHRASES,
+    CURRENCY_TOKENS,
+)
 
 logger = logging.getLogger(__name__)
 
+# First Andes price fraction in the raw HTML. Only plain-text fractions followed
+# directly by their cents span, or by the end of the parent element, are
+# accepted; anything else is left to the CSS selectors.
+_ANDES_PRICE_RE = re.compile(
+    r'<span[^>]*\sclass="(?:[^"]*\s)?andes-money-amount__fraction(?:\s[^"]*)?"[^>]*>'
+    r'(?P<fraction>[^<]*)</span>\s*'
+    r'(?:<span[^>]*\sclass="(?:[^"]*\s)?andes-money-amount__cents(?:\s[^"]*)?"[^>]*>'
+    r'(?P<cents>[^<]*)</span>|(?=</))'
+)
+_ANDES_FRACTION_TAG_RE = re.compile(
+    r'<span[^>]*\sclass="(?:[^"]*\s)?andes-money-amount__fraction(?:\s[^"]*)?"'
+)
+
+# Mercado Livre-specific unavailability indicators
+ML_UNAVAILABLE_PHRASES = (
+    'pausado temporariamente',
+    'publicação pausada',
+    'vendedor sem estoque',
+    'estoque do vendedor esgotado',
+    'anúncio pausado',
+    'produto não disponível',
+)
+
 class MercadoLivreScraper(BaseScraper):
     """
     Scraper for Mercado Livre (mercadolivre.com.br)
     """
 
-    def get_price_selectors(self) -> List[str]:
-        """
-        Get CSS selectors for extracting price from Mercado Livre HTML.
+    scrape_source = 'mercadolivre'
+    default_currency = 'BRL'
 
-        Selectors are ordered by reliability/preference.
-        Mercado Livre uses Andes Design System for their UI components.
+    # Base and Mercado Livre phrases in one matcher, so a page is scanned once
+    _unavailable_matcher = PhraseMatcher(
+        UNAVAILABLE_PHRASES + ML_UNAVAILABLE_PHRASES, tokens=CURRENCY_TOKENS
+    )
 
-        Returns:
-           List of CSS selectors to try in order.
-        """ 
-        return [
-            # Primary: Andes Design System money component
-            'span.andes-money-amount__fraction',
+    # Price selectors ordered by reliability/preference.
+    # Mercado Livre uses Andes Design System for their UI components.
+    PRICE_SELECTORS = (
+        # Primary: Andes Design System money component
+        'span.andes-money-amount__fraction',
 
-            # Alternative: Old price tag format
-            'span.price-tag-fraction',
+        # Alternative: Old price tag format
+        'span.price-tag-fraction',
 
-            # Fallback: Price tag amount
-            'span.price-tag-amount',
+        # Fallback: Price tag amount
+        'span.price-tag-amount',
 
-            # Meta tag fallback (structured data)
-            'meta[property="og:price:amount"]',
+        # Meta tag fallback (structured data)
+        'meta[property="og:price:amount"]',
 
-            # JSON-LD structured data (last resort)
-            'script[type="application/ld+json"]',
-        ]
+        # JSON-LD structured data is read by extract_price_jsonld() as a last resort
+    )
 
-    def scrape_price(self, url: str, product_link_id: str) -> ScrapingResult:
+    def get_price_selectors(self) -> Sequence[str]:
         """
-        Scrape price and availability from a Mercado Livre product page.
+        Get CSS selectors for extracting price from Mercado Livre HTML.
+
+        The selectors are built once on the class and shared by every scrape.
+
+        Returns:
+           Sequence of CSS selectors to try in order.
+        """ 
+        return self.PRICE_SELECTORS
+
+    def parse_page(
+        self,
+        html: str,
+        url: str,
+        product_link_id: str,
+        start_time: float
+    ) -> ScrapingResult:
+        """
+        Extract price and availability from a Mercado Livre product page.
 
         Args:
+            html: HTML content of the product page
             url: Mercado Livre product URL
             product_link_id: Database ID of the product link
+            start_time: time.monotonic() when the scrape started, for response_time_ms
         
         Returns:
             ScrapingResult with price data and metadata
         """
-        start_time = time.time()
-
-        try:
-            # Fetch HTML content
-            html = self.fetch_html(url)
-
-            if not html:
-                response_time = int((time.time() - start_time) * 1000)
-                return ScrapingResult(
-                    product_link_id=product_link_id,
-                    url=url,
-                    price=None,
-                    original_price=None,
-                    currency='BRL',
-                    was_available=False,
-                    scrape_source='mercadolivre',
-                    response_time_ms=response_time,
-                    error='Failed to fetch HTML'
-                )
-
-            # Extract price
-            price = self.extract_price_from_html(html, self.get_price_selectors())
-
-            # Check availability
-            is_available = self.is_product_available(html)
-
-            #Extract currency (should be BRL for Mercado Livre)
-            currency = self.extract_currency(html, default='BRL')
-
-            response_time = int((time.time() - start_time) * 1000)
-
-            #Log results
-            if price:
-                logger.info(
-                    f"Successfully scraped Mercado Livre product: "
-                    f"R$ {price:.2f} (available: {is_available}) in {response_time}ms"
-                )
-            else:
-                logger.warning(
-                    f"Price not found for Mercado Livre product: {url}"
-                    f"(available: {is_available})"
-                )
-            
-            return ScrapingResult(
-                product_link_id=product_link_id,
-                url=url,
-                price=price,
-                original_price=None,  # Not tracking original prices per requirements
-                currency=currency,
-                was_available=is_available,
-                scrape_source='mercadolivre',
-                response_time_ms=response_time,
-                error=None if price else 'Price element not found'
+        # Extract price
+        price = self.extract_price_from_html(html, self.get_price_selectors())
+
+        # Check availability and extract currency (should be BRL for Mercado Livre)
+        is_available, currency = self.scan_page(html, default_currency=self.default_currency)
+
+        response_time = int((time.monotonic() - start_time) * 1000)
+
+        #Log results
+        if price:
+            logger.info(
+                "Successfully scraped Mercado Livre product: "
+                "R$ %.2f (available: %s) in %dms",
+                price, is_available, response_time
             )
-        
-        except Exception as e:
-            response_time = int((time.time() - start_time) * 1000)
-            logger.error(f"Error scraping Mercado Livre product {url}: {str(e)}")
-            
-            return ScrapingResult(
-                product_link_id=product_link_id,
-                url=url,
-                price=None,
-                original_price=None,
-                currency='BRL',
-                was_available=False,
-                scrape_source='mercadolivre',
-                response_time_ms=response_time,
-                error=str(e)
+        else:
+            logger.warning(
+                "Price not found for Mercado Livre product: %s "
+                "(available: %s)",
+                url, is_available
             )
-
-    def is_product_available(self, html: str) -> bool:
+        
+        return ScrapingResult(
+            product_link_id=product_link_id,
+            url=url,
+            price=price,
+            original_price=None,  # Not tracking original prices per requirements
+            currency=currency,
+            was_available=is_available,
+            scrape_source=self.scrape_source,
+            response_time_ms=response_time,
+            error=None if price else 'Price element not found'
+        )
+
+    def extract_price_fast(self, html: str) -> Optional[float]:
         """
-        Check if product is available on Mercado Livre.
+        Read the Andes money amount straight from the raw HTML.
 
-        Extends base class method with Mercado Livre-specific phrases.
+        Most product pages render the price as a plain fraction span followed
+        by its cents, which a regex can pick up without building a DOM tree.
 
         Args:
-            html: HTML content to check
+            html: HTML content to scan
 
         Returns:
-            True if product appears to be available
+            Extracted price as float, or None to fall back to the CSS selectors
         """
-        #Check base unavailability phrases first
-        if not super().is_product_available(html):
-            return False
-
-        # Mercado Livre-specific unavailability indicators
-        ml_unavailable_phrases = [
-            'pausado temporariamente',
-            'publicação pausada',
-            'vendedor sem estoque',
-            'estoque do vendedor esgotado',
-            'anúncio pausado',
-            'produto não disponível',
-        ]
-
-        html_lower = html.lower()
-        return not any(phrase in html_lower for phrase in ml_unavailable_phrases)
+        tag = _ANDES_FRACTION_TAG_RE.search(html)
+        if not tag:
+            return None
+
+        # Must be the same element the selectors would pick first
+        match = _ANDES_PRICE_RE.match(html, tag.start())
+        if not match:
+            return None
+
+        text = match.group('fraction').strip()
+        if match.group('cents'):
+            text = f"{text},{match.group('cents').strip()}"
+        return self.parse_price_text(text)
 
     def _get_price_text(self, element) -> str:
         """
         Extract price text, handling Mercado Livre's split fraction/cents structure.
         """
 
-        text = element.get_text().strip()
+        text = super()._get_price_text(element)
 
         # Check if we are dealing with the Andes money component fraction
-        classes = element.get('class', [])
+        classes = (element.attributes.get('class') or '').split()
 
         cents_selector = None
         if 'andes-money-amount__fraction' in classes:
@@ -172,9 +181,9 @@ class MercadoLivreScraper(BaseScraper):
         if cents_selector:
             parent = element.parent
             if parent:
-                cents_element = parent.select_one(cents_selector)
+                cents_element = parent.css_first(cents_selector)
                 if cents_element:
-                    cents_text = cents_element.get_text().strip()
+                    cents_text = cents_element.text(strip=True)
                     # Return with comma separator for Brazilian format parser
                     return f"{text},{cents_text}"
         
@@ -16,7 +16,7 @@ def test_connection():
                 cur.execute("SELECT version();")
                 version = cur.fetchone()
                 print(f"✅ Connected to PostgresSQL!")
-                print(f"📊 Version: {version['version']}")
+                print(f"📊 Version: {version.version}")
         
         print("\n🔄 Testing table access...")
         with db.get_connection() as conn:
@@ -29,7 +29,7 @@ def test_connection():
                 tables = cur.fetchall()
                 print(f"✅ Found {len(tables)} tables:")
                 for table in tables:
-                    print(f"  - {table['table_name']}")
+                    print(f"  - {table.table_name}")
 
         print("\n ✅ All database tests passed!")
         return True
@@ -4,7 +4,7 @@ Pytest configuration for integration tests.
 This file sets up a real PostgreSQL database in a Docker container that all integration tests can use.
 """
 import pytest
-import psycopg2
+import psycopg
 from testcontainers.postgres import PostgresContainer
 from utils.logger import get_logger
 
@@ -24,7 +24,7 @@ def postgres_container():
     """
     logger.info("Starting PostgreSQL test container...")
 
-    with PostgresContainer("postgres:15-alpine") as postgres:
+    with PostgresContainer("postgres:15-alpine", driver="psycopg") as postgres:
         logger.info(f"PostgreSQL container started on port {postgres.get_exposed_port(5432)}")
         yield postgres
 
@@ -38,7 +38,7 @@ def test_database_url(postgres_container):
     This URL is automatically generated by testcontainers and points to the Docker container.
     """
     url = postgres_container.get_connection_url()
-    return url.replace("postgresql+psycopg2://", "postgresql://")
+    return url.replace("postgresql+psycopg://", "postgresql://")
 
 @pytest.fixture(scope="session")
 def database_schema(test_database_url):
@@ -49,8 +49,7 @@ def database_schema(test_database_url):
     """
     logger.info("Setting up database schema...")
 
-    conn = psycopg2.connect(test_database_url)
-    conn.autocommit = True
+    conn = psycopg.connect(test_database_url, autocommit=True)
     cur = conn.cursor()
 
     # Create tables matching production schema exactly
@@ -141,8 +140,7 @@ def clean_database(test_database_url, database_schema):
     yield
 
     # Run after each test - clean up data
-    conn = psycopg2.connect(test_database_url)
-    conn.autocommit = True
+    conn = psycopg.connect(test_database_url, autocommit=True)
     cur = conn.cursor()
 
     # Delete in reverse order of foreign key dependencies
@@ -164,8 +162,7 @@ def sample_user(test_database_url):
             user_id = sample_user['id']
             # ... your test code
     """
-    conn = psycopg2.connect(test_database_url)
-    conn.autocommit = True
+    conn = psycopg.connect(test_database_url, autocommit=True)
     cur = conn.cursor()
 
     cur.execute("""
@@ -178,8 +175,9 @@ def sample_user(test_database_url):
     cur.close()
     conn.close()
 
+    # IDs as str, matching what DatabaseClient returns for uuid columns
     return {
-        'id': user[0],
+        'id': str(user[0]),
         'email': user[1],
         'name': user[2]
     }
@@ -191,8 +189,7 @@ def sample_product(test_database_url, sample_user):
 
     Automatically creates a user first (depends on sample_user fixture).
     """
-    conn = psycopg2.connect(test_database_url)
-    conn.autocommit = True
+    conn = psycopg.connect(test_database_url, autocommit=True)
     cur = conn.cursor()
 
     cur.execute("""
@@ -222,9 +219,9 @@ def sample_product(test_database_url, sample_user):
     conn.close()
 
     return {
-        'id': product[0],
+        'id': str(product[0]),
         'name': product[1],
-        'user_id': product[2],
+        'user_id': str(product[2]),
         'target_price': product[3]
     }
 
@@ -235,8 +232,7 @@ def sample_product_link(test_database_url, sample_product):
 
     This is particularly useful for scraper tests!
     """
-    conn = psycopg2.connect(test_database_url)
-    conn.autocommit = True
+    conn = psycopg.connect(test_database_url, autocommit=True)
     cur = conn.cursor()
 
     cur.execute("""
@@ -264,8 +260,8 @@ def sample_product_link(test_database_url, sample_product):
     conn.close()
 
     return {
-        'id': link[0],
+        'id': str(link[0]),
         'url': link[1],
         'store': link[2],
-        'product_id': link[3]
+        'product_id': str(link[3])
     }
\ No newline at end of file
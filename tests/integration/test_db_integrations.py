@@ -5,9 +5,10 @@ These tests use a REAL PostgresSQL database running in Docker.
 No mocking - we test actual database operations!
 """
 from random import sample
+import asyncio
 import pytest
 import os
-import psycopg2
+from psycopg.rows import dict_row
 from decimal import Decimal
 from utils.db_client import DatabaseClient
 import utils.db_client
@@ -27,13 +28,17 @@ class TestDatabaseClientIntegration:
         # Set the test database URL
         os.environ['DATABASE_URL'] = test_database_url
 
-        # Reset module-level connection pool
-        utils.db_client._connection_pool = None
+        # Reset module-level connection pools
+        utils.db_client._close_connection_pool()
+        utils.db_client._POOL_CLIENTS.clear()
+        utils.db_client._ASYNC_POOLS.clear()
 
         yield
 
         # Cleanup after each test
-        utils.db_client._connection_pool = None
+        utils.db_client._close_connection_pool()
+        utils.db_client._POOL_CLIENTS.clear()
+        utils.db_client._ASYNC_POOLS.clear()
         if 'DATABASE_URL' in os.environ:
             del os.environ['DATABASE_URL']
     
@@ -45,13 +50,13 @@ class TestDatabaseClientIntegration:
         """
         db = DatabaseClient()
 
-        with db.get_connection() as conn:
+        with db.get_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 cur.execute("SELECT 1 as test_value")
                 result = cur.fetchone()
 
-                # Result should be a dict because we use RealDictCursor
-                assert result['test_value'] == 1
+                # Rows are named tuples by default
+                assert result.test_value == 1
     
     def test_connection_pool_reuse(self, test_database_url):
         """
@@ -63,12 +68,12 @@ class TestDatabaseClientIntegration:
         import utils.db_client
 
         # Verify pool doesn't exist yet (setup fixture should have reset it)
-        assert utils.db_client._connection_pool is None, \
-            "Connection pool should be None at test start"
+        assert test_database_url not in utils.db_client._POOLS, \
+            "Connection pool should not exist at test start"
 
         # Create first instance
         db1 = DatabaseClient()
-        pool_after_db1 = utils.db_client._connection_pool
+        pool_after_db1 = db1._pool
 
         # Pool should now exist
         assert pool_after_db1 is not None, \
@@ -76,24 +81,25 @@ class TestDatabaseClientIntegration:
         
         # Create second instance
         db2 = DatabaseClient()
-        pool_after_db2 = utils.db_client._connection_pool
+        pool_after_db2 = db2._pool
 
         # Both instances MUST reference the SAME pool object
         assert pool_after_db1 is pool_after_db2, \
             "db1 and db2 must share the same connection pool instance (not separate pools)"
+        assert utils.db_client._POOLS[test_database_url] is pool_after_db1
 
         # Verify the shared pool actually works for both instances
         with db1.get_connection() as conn1:
             with conn1.cursor() as cur:
                 cur.execute("SELECT 1 as value")
                 result = cur.fetchone()
-                assert result['value'] == 1
+                assert result.value == 1
         
         with db2.get_connection() as conn2:
             with conn2.cursor() as cur:
                 cur.execute("SELECT 2 as value")
                 result = cur.fetchone()
-                assert result['value'] == 2
+                assert result.value == 2
 
         # If we got here, connection pool reuse is verified and working!
 
@@ -114,10 +120,10 @@ class TestDatabaseClientIntegration:
                     VALUES (%s, %s, %s, %s)
                     RETURNING id
                 """, (sample_user['id'], 'Integration Test Product', 'Test description', True))
-                product_id = cur.fetchone()['id']
+                product_id = cur.fetchone().id
         
         # Verify it was committed by reading in a NEW connection
-        with db.get_connection() as conn:
+        with db.get_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT name, description FROM products WHERE id = %s
@@ -125,8 +131,8 @@ class TestDatabaseClientIntegration:
                 result = cur.fetchone()
 
                 assert result is not None
-                assert result['name'] == 'Integration Test Product'
-                assert result['description'] == 'Test description'
+                assert result.name == 'Integration Test Product'
+                assert result.description == 'Test description'
     
     def test_transaction_rollback(self, test_database_url, sample_user):
         """
@@ -148,7 +154,7 @@ class TestDatabaseClientIntegration:
                     # Raise an error before commit
                     raise Exception("Test error")
 
-        with db.get_connection() as conn:
+        with db.get_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT COUNT(*) as count
@@ -157,17 +163,44 @@ class TestDatabaseClientIntegration:
                 """)
                 result = cur.fetchone()
 
-                assert result['count'] == 0
+                assert result.count == 0
     
+    def test_commit_and_begin(self, test_database_url, sample_user):
+        """
+        Work committed with commit_and_begin survives a later rollback in the same lease.
+        """
+        db = DatabaseClient()
+
+        with pytest.raises(Exception):
+            with db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "INSERT INTO products (user_id, name) VALUES (%s, %s)",
+                        (sample_user['id'], 'Committed Early')
+                    )
+                    db.commit_and_begin(conn)
+                    cur.execute(
+                        "INSERT INTO products (user_id, name) VALUES (%s, %s)",
+                        (sample_user['id'], 'Rolled Back')
+                    )
+                    raise Exception("Test error")
+
+        with db.get_connection(readonly=True) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT name FROM products ORDER BY name")
+                names = [row.name for row in cur.fetchall()]
+
+        assert names == ['Committed Early']
+
     def test_real_dict_cursor(self, test_database_url, sample_product):
         """
-        Test 5: RealDictCursor returns dictionaries (not tuples).
+        Test 5: dict_row returns dictionaries (not tuples).
 
         This makes your Lambda code cleaner - you can access columns by name!
         """
         db = DatabaseClient()
 
-        with db.get_connection() as conn:
+        with db.get_connection(readonly=True, row_factory=dict_row) as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT id, name, is_active, target_price, currency
@@ -193,20 +226,15 @@ class TestDatabaseClientIntegration:
         db = DatabaseClient()
 
         # Insert multiple products
-        with db.get_connection() as conn:
-            with conn.cursor() as cur:
-                products = [
-                    (sample_user['id'], 'Product 1', 'Description 1'),
-                    (sample_user['id'], 'Product 2', 'Description 2'),
-                    (sample_user['id'], 'Product 3', 'Description 3'),
-                ]
-                cur.executemany("""
-                    INSERT INTO products (user_id, name, description)
-                    VALUES (%s, %s, %s)
-                """, products)
+        products = [
+            (sample_user['id'], 'Product 1', 'Description 1'),
+            (sample_user['id'], 'Product 2', 'Description 2'),
+            (sample_user['id'], 'Product 3', 'Description 3'),
+        ]
+        db.bulk_insert('products', ('user_id', 'name', 'description'), products)
         
         # Fetch them all
-        with db.get_connection() as conn:
+        with db.get_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT name, description FROM products
@@ -216,9 +244,9 @@ class TestDatabaseClientIntegration:
                 results = cur.fetchall()
 
                 assert len(results) == 3
-                assert results[0]['name'] == 'Product 1'
-                assert results[1]['name'] == 'Product 2'
-                assert results[2]['name'] == 'Product 3'
+                assert results[0].name == 'Product 1'
+                assert results[1].name == 'Product 2'
+                assert results[2].name == 'Product 3'
     
     def test_concurrent_connections(self, test_database_url):
         """
@@ -238,8 +266,27 @@ class TestDatabaseClientIntegration:
                     cur2.execute("SELECT 2 as value")
                     result2 = cur2.fetchone()
                 
-                assert result1['value'] == 1
-                assert result2['value'] == 2
+                assert result1.value == 1
+                assert result2.value == 2
+
+    def test_async_concurrent_connections(self, test_database_url):
+        """
+        Coroutines each get their own pooled connection and run queries concurrently.
+        """
+        db = DatabaseClient()
+
+        async def fetch_value(value):
+            async with db.async_connection() as conn:
+                cur = await conn.execute("SELECT %s::int as value, pg_sleep(0.1)", (value,))
+                return (await cur.fetchone())['value']
+
+        async def fetch_all():
+            try:
+                return await asyncio.gather(*(fetch_value(i) for i in range(5)))
+            finally:
+                await db.aclose()
+
+        assert asyncio.run(fetch_all()) == [0, 1, 2, 3, 4]
 
     def test_uuid_primary_keys(self, test_database_url, sample_user):
         """
@@ -257,7 +304,7 @@ class TestDatabaseClientIntegration:
                     VALUES (%s, %s)
                     RETURNING id
                 """, (sample_user['id'], 'UUID Test Product'))
-                product_id = cur.fetchone()['id']
+                product_id = cur.fetchone().id
 
                 assert isinstance(product_id, str)
                 assert len(product_id) == 36
@@ -292,9 +339,9 @@ class TestDatabaseClientIntegration:
                 ))
                 result = cur.fetchone()
                 
-                assert result['url'] == 'https://www.amazon.com/dp/B08N5WRWNW'
-                assert result['store'] == 'amazon'
-                assert result['product_identifier'] == 'B08N5WRWNW'
+                assert result.url == 'https://www.amazon.com/dp/B08N5WRWNW'
+                assert result.store == 'amazon'
+                assert result.product_identifier == 'B08N5WRWNW'
 
     def test_price_history_insertion(self, test_database_url, sample_product_link):
         """
@@ -331,9 +378,9 @@ class TestDatabaseClientIntegration:
                 ))
                 result = cur.fetchone()
                 
-                assert result['price'] == Decimal('79.99')
-                assert result['original_price'] == Decimal('99.99')
-                assert result['discount_percentage'] == Decimal('20.00')
+                assert result.price == Decimal('79.99')
+                assert result.original_price == Decimal('99.99')
+                assert result.discount_percentage == Decimal('20.00')
     
     def test_fetch_active_product_links(self, test_database_url, sample_product_link):
         """
@@ -343,7 +390,7 @@ class TestDatabaseClientIntegration:
         """
         db = DatabaseClient()
         
-        with db.get_connection() as conn:
+        with db.get_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 # This is the type of query your scraper will use
                 cur.execute("""
@@ -363,48 +410,183 @@ class TestDatabaseClientIntegration:
                 results = cur.fetchall()
                 
                 assert len(results) >= 1
-                assert results[0]['store'] == 'amazon'
-                assert results[0]['url'] == 'https://www.amazon.com/dp/B08N5WRWNW'
+                assert results[0].store == 'amazon'
+                assert results[0].url == 'https://www.amazon.com/dp/B08N5WRWNW'
     
+    def test_iter_active_product_links(self, test_database_url, sample_product_link):
+        """
+        The work list can be streamed through a server-side cursor.
+        """
+        db = DatabaseClient()
+
+        links = list(db.iter_active_product_links(batch=1))
+
+        assert [link.url for link in links] == ['https://www.amazon.com/dp/B08N5WRWNW']
+        assert links[0].store == 'amazon'
+
     def test_update_product_link_after_scrape(self, test_database_url, sample_product_link):
         """
         Test 12: Update product link after scraping.
         
-        After scraping, your Lambda updates last_price and last_checked_at.
+        After scraping, your Lambda updates last_price and last_checked_at
+        and records the price, both on one session.
         """
         db = DatabaseClient()
         
         # Scrape and update
         new_price = Decimal('89.99')
         
-        with db.get_connection() as conn:
+        with db.session() as cur:
+            cur.execute("""
+                UPDATE product_links
+                SET 
+                    last_price = %s,
+                    last_checked_at = now(),
+                    lowest_price_seen = COALESCE(
+                        LEAST(lowest_price_seen, %s), 
+                        %s
+                    ),
+                    highest_price_seen = COALESCE(
+                        GREATEST(highest_price_seen, %s), 
+                        %s
+                    )
+                WHERE id = %s
+                RETURNING last_price, lowest_price_seen, highest_price_seen
+            """, (
+                new_price, 
+                new_price, new_price,  # For lowest_price_seen
+                new_price, new_price,  # For highest_price_seen
+                sample_product_link['id']
+            ))
+            result = cur.fetchone()
+            
+            assert result.last_price == new_price
+            assert result.lowest_price_seen == new_price
+            assert result.highest_price_seen == new_price
+
+            cur.execute("""
+                INSERT INTO price_history (product_link_id, price, currency, was_available)
+                VALUES (%s, %s, %s, %s)
+            """, (sample_product_link['id'], new_price, 'USD', True))
+
+        with db.get_connection(readonly=True) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT price FROM price_history WHERE product_link_id = %s",
+                    (sample_product_link['id'],)
+                )
+                assert [row.price for row in cur.fetchall()] == [new_price]
+
+    def test_bulk_update_product_links(self, test_database_url, sample_product_link):
+        """
+        Product links are updated in one set-based statement and keep their price stats.
+        """
+        db = DatabaseClient()
+        link_id = sample_product_link['id']
+
+        db.bulk_update_product_links([(link_id, 89.99)])
+        db.bulk_update_product_links([(link_id, 99.99)])
+
+        with db.get_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 cur.execute("""
-                    UPDATE product_links
-                    SET 
-                        last_price = %s,
-                        last_checked_at = now(),
-                        lowest_price_seen = COALESCE(
-                            LEAST(lowest_price_seen, %s), 
-                            %s
-                        ),
-                        highest_price_seen = COALESCE(
-                            GREATEST(highest_price_seen, %s), 
-                            %s
-                        )
-                    WHERE id = %s
-                    RETURNING last_price, lowest_price_seen, highest_price_seen
-                """, (
-                    new_price, 
-                    new_price, new_price,  # For lowest_price_seen
-                    new_price, new_price,  # For highest_price_seen
-                    sample_product_link['id']
-                ))
+                    SELECT last_price, lowest_price_seen, highest_price_seen, last_checked_at
+                    FROM product_links WHERE id = %s
+                """, (link_id,))
                 result = cur.fetchone()
-                
-                assert result['last_price'] == new_price
-                assert result['lowest_price_seen'] == new_price
-                assert result['highest_price_seen'] == new_price
+
+        assert result.last_price == Decimal('99.99')
+        assert result.lowest_price_seen == Decimal('89.99')
+        assert result.highest_price_seen == Decimal('99.99')
+        assert result.last_checked_at is not None
+
+    def test_copy_price_history(self, test_database_url, sample_product_link):
+        """
+        COPY loads price history rows, including NULLs.
+        """
+        db = DatabaseClient()
+        rows = [
+            (sample_product_link['id'], 10 + i, None, None, 'BRL', True, 'backfill', None)
+            for i in range(60)
+        ]
+
+        db.copy_price_history(rows)
+
+        with db.get_connection(readonly=True) as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT COUNT(*) AS count, MIN(price) AS low, COUNT(original_price) AS originals
+                    FROM price_history WHERE product_link_id = %s
+                """, (sample_product_link['id'],))
+                result = cur.fetchone()
+
+        assert result.count == 60
+        assert result.low == Decimal('10.00')
+        assert result.originals == 0
+
+    def _scrape_batches(self, link_id):
+        """A successful scrape followed by a failed one, as separate batches."""
+        from scrapers.base import ScrapingResult
+
+        return [
+            [ScrapingResult(str(link_id), 'https://a', 89.99, None, 'BRL', True, 'mercadolivre', 120)],
+            [ScrapingResult(str(link_id), 'https://a', None, None, 'BRL', True, 'mercadolivre', 90,
+                            error='Price element not found')],
+        ]
+
+    def _assert_scrape_recorded(self, db, link_id):
+        with db.get_connection(readonly=True) as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT last_price, lowest_price_seen, scrape_error_count
+                    FROM product_links WHERE id = %s
+                """, (link_id,))
+                link = cur.fetchone()
+                cur.execute(
+                    "SELECT price FROM price_history WHERE product_link_id = %s",
+                    (link_id,)
+                )
+                history = cur.fetchall()
+
+        assert link.last_price == Decimal('89.99')
+        assert link.lowest_price_seen == Decimal('89.99')
+        assert link.scrape_error_count == 1
+        assert [row.price for row in history] == [Decimal('89.99')]
+
+    def test_record_scrape_results(self, test_database_url, sample_product_link):
+        """
+        A scrape batch updates product_links and appends price_history in one transaction.
+        """
+        db = DatabaseClient()
+        for batch in self._scrape_batches(sample_product_link['id']):
+            db.record_scrape_results(batch)
+        self._assert_scrape_recorded(db, sample_product_link['id'])
+
+    def test_record_scrape_result_prepared(self, test_database_url, sample_product_link):
+        """
+        Single results go through the statements prepared on each pooled connection.
+        """
+        db = DatabaseClient()
+        for (result,) in self._scrape_batches(sample_product_link['id']):
+            db.record_scrape_result(result)
+        self._assert_scrape_recorded(db, sample_product_link['id'])
+
+    def test_async_record_scrape_results(self, test_database_url, sample_product_link):
+        """
+        The pipelined async writer leaves the same rows as the sync one.
+        """
+        db = DatabaseClient()
+
+        async def record(batch):
+            try:
+                await db.async_record_scrape_results(batch)
+            finally:
+                await db.aclose()
+
+        for batch in self._scrape_batches(sample_product_link['id']):
+            asyncio.run(record(batch))
+        self._assert_scrape_recorded(db, sample_product_link['id'])
+        assert test_database_url not in utils.db_client._ASYNC_POOLS
 
     def test_cascade_delete(self, test_database_url, sample_user):
         """
@@ -423,7 +605,7 @@ class TestDatabaseClientIntegration:
                     VALUES(%s, %s)
                     RETURNING id
                 """, (sample_user['id'], 'Will be deleted'))
-                product_id = cur.fetchone()['id']
+                product_id = cur.fetchone().id
 
         # Delete the user
         with db.get_connection() as conn:
@@ -431,7 +613,7 @@ class TestDatabaseClientIntegration:
                 cur.execute("DELETE FROM users WHERE id = %s", (sample_user['id'],))
         
         # Verify product was cascade deleted
-        with db.get_connection() as conn:
+        with db.get_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT COUNT(*) as count
@@ -440,4 +622,4 @@ class TestDatabaseClientIntegration:
                 """, (product_id,))
                 result = cur.fetchone()
 
-                assert result['count'] == 0
\ No newline at end of file
+                assert result.count == 0
\ No newline at end of file
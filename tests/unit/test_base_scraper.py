@@ -1 +1,399 @@
+import asyncio
+import gzip
+import httpx
+import pytest
+from unittest.mock import patch
+from scrapers.base import PhraseMatcher
+from scrapers.mercadolivre import MercadoLivreScraper
 
+
+class TestFetchHtml:
+    """Test suite for fetching pages over HTTP"""
+
+    def _scraper_with_transport(self, handler):
+        scraper = MercadoLivreScraper()
+        scraper.session = httpx.Client(transport=httpx.MockTransport(handler))
+        return scraper
+
+    def test_returns_page_text_and_sends_user_agent(self):
+        """Test that a successful fetch returns the body with a per-request User-Agent"""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get('User-Agent'))
+            return httpx.Response(200, text="<html>ok</html>")
+
+        scraper = self._scraper_with_transport(handler)
+        assert scraper.fetch_html("https://example.com/item") == "<html>ok</html>"
+        assert seen and seen[0]
+
+    def test_truncates_oversized_pages(self):
+        """Test that bodies beyond max_html_bytes are cut off while streaming"""
+        def handler(request):
+            return httpx.Response(200, content=b"a" * 100_000)
+
+        scraper = self._scraper_with_transport(handler)
+        scraper.max_html_bytes = 20_000
+
+        html = scraper.fetch_html("https://example.com/huge")
+        assert 20_000 <= len(html) < 100_000
+
+    def test_decompresses_undeclared_gzip_body(self):
+        """Test that raw GZIP bytes without a Content-Encoding header are decoded"""
+        def handler(request):
+            return httpx.Response(200, content=gzip.compress("<p>preço</p>".encode()))
+
+        scraper = self._scraper_with_transport(handler)
+        assert scraper.fetch_html("https://example.com/raw-gzip") == "<p>preço</p>"
+
+    @patch('scrapers.base.time.sleep')
+    def test_returns_none_on_not_found_without_retry(self, mock_sleep):
+        """Test that 404 responses are not retried"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        scraper = self._scraper_with_transport(handler)
+        assert scraper.fetch_html("https://example.com/gone") is None
+        assert len(calls) == 1
+        mock_sleep.assert_not_called()
+
+    @patch('scrapers.base.time.sleep')
+    def test_retries_on_server_error(self, mock_sleep):
+        """Test that server errors are retried up to max_retries"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        scraper = self._scraper_with_transport(handler)
+        assert scraper.fetch_html("https://example.com/down") is None
+        assert len(calls) == scraper.max_retries
+
+    @patch('scrapers.base.time.sleep')
+    def test_stops_retrying_when_fetch_budget_is_spent(self, mock_sleep):
+        """Test that backoff never sleeps past max_fetch_seconds"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429)
+
+        scraper = self._scraper_with_transport(handler)
+        scraper.max_fetch_seconds = 1
+
+        assert scraper.fetch_html("https://example.com/busy") is None
+        assert len(calls) == 1
+        mock_sleep.assert_not_called()
+
+    def test_zero_retries_fetches_nothing(self):
+        """Test that max_retries=0 gives up without a request instead of failing"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, text="<html>ok</html>")
+
+        scraper = self._scraper_with_transport(handler)
+        scraper.max_retries = 0
+
+        assert scraper.fetch_html("https://example.com/item") is None
+
+        async def fetch():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await scraper._fetch_html_async(client, "https://example.com/item")
+
+        assert asyncio.run(fetch()) is None
+        assert calls == []
+
+
+PRODUCT_PAGE = """
+    <div class="andes-money-amount">
+        <span class="andes-money-amount__fraction">249</span>
+        <span class="andes-money-amount__cents">90</span>
+    </div>
+"""
+
+
+def _page_handler(request):
+    if request.url.path == '/gone':
+        return httpx.Response(404)
+    return httpx.Response(200, text=PRODUCT_PAGE)
+
+
+class TestScrapePrice:
+    """Test suite for single and batched product scraping"""
+
+    def test_scrape_price_builds_result(self):
+        """Test that a single scrape returns a populated ScrapingResult"""
+        scraper = MercadoLivreScraper()
+        scraper.session = httpx.Client(transport=httpx.MockTransport(_page_handler))
+
+        result = scraper.scrape_price("https://example.com/item", "link-1")
+
+        assert result.price == 249.90
+        assert result.was_available is True
+        assert result.scrape_source == 'mercadolivre'
+        assert result.error is None
+
+    def test_scrape_prices_keeps_input_order(self):
+        """Test that batched scrapes return one result per link, in order"""
+        scraper = MercadoLivreScraper()
+        scraper._create_async_client = lambda: httpx.AsyncClient(
+            transport=httpx.MockTransport(_page_handler)
+        )
+
+        results = asyncio.run(scraper.scrape_prices([
+            ("https://example.com/item", "link-1"),
+            ("https://example.com/gone", "link-2"),
+        ]))
+
+        assert [r.product_link_id for r in results] == ["link-1", "link-2"]
+        assert results[0].price == 249.90
+        assert results[1].price is None
+        assert results[1].error == 'Failed to fetch HTML'
+
+
+class TestPriceExtraction:
+    """Test suite for HTML price extraction"""
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = MercadoLivreScraper()
+        yield scraper
+        scraper.close()
+
+    def test_extracts_andes_fraction_with_cents(self, scraper):
+        """Test that the Andes fraction is combined with its sibling cents"""
+        html = """
+            <div class="andes-money-amount">
+                <span class="andes-money-amount__fraction" aria-hidden="true">1.299</span>
+                <span class="andes-money-amount__cents">90</span>
+            </div>
+        """
+        price = scraper.extract_price_from_html(html, scraper.get_price_selectors())
+        assert price == 1299.90
+
+    def test_falls_back_to_price_tag_fraction(self, scraper):
+        """Test the legacy price-tag markup is used when Andes is missing"""
+        html = """
+            <span class="price-tag">
+                <span class="price-tag-fraction">79</span>
+                <span class="price-tag-cents">99</span>
+            </span>
+        """
+        price = scraper.extract_price_from_html(html, scraper.get_price_selectors())
+        assert price == 79.99
+
+    def test_reads_meta_content_attribute(self, scraper):
+        """Test that og:price:amount is read from the content attribute"""
+        html = '<html><head><meta property="og:price:amount" content="149.90"></head></html>'
+        price = scraper.extract_price_from_html(html, scraper.get_price_selectors())
+        assert price == 149.90
+
+    def test_fast_path_skips_html_parsing(self, scraper):
+        """Test that plain Andes markup is read without building a DOM tree"""
+        html = (
+            '<div><span class="andes-money-amount__fraction" aria-hidden="true">1.299</span>'
+            '<span class="andes-money-amount__cents andes-money-amount__cents--superscript-24">90</span></div>'
+        )
+        with patch('scrapers.base.LexborHTMLParser') as mock_parser:
+            price = scraper.extract_price_from_html(html, scraper.get_price_selectors())
+
+        assert price == 1299.90
+        mock_parser.assert_not_called()
+
+    def test_fast_path_defers_irregular_markup_to_selectors(self, scraper):
+        """Test that markup the regex can't vouch for falls back to the DOM"""
+        html = """
+            <div>
+                <span class="andes-money-amount__fraction">249</span>
+                <span class="andes-money-amount__decimal-separator">,</span>
+                <span class="andes-money-amount__cents">90</span>
+            </div>
+        """
+        assert scraper.extract_price_fast(html) is None
+        assert scraper.extract_price_from_html(html, scraper.get_price_selectors()) == 249.90
+
+    def test_falls_back_to_jsonld_offer_price(self, scraper):
+        """Test that the JSON-LD offer price is used when no selector matches"""
+        html = """
+            <script>window.state = {"price": 1}</script>
+            <script type="application/ld+json">
+                {"@type": "Product", "offers": {"@type": "Offer", "price": "349.9", "priceCurrency": "BRL"}}
+            </script>
+        """
+        assert scraper.extract_price_from_html(html, scraper.get_price_selectors()) == 349.90
+
+    def test_jsonld_search_stays_inside_its_block(self, scraper):
+        """Test that a price in inline state after a non-offer JSON-LD block is ignored"""
+        html = """
+            <script type="application/ld+json">
+                {"@type": "BreadcrumbList", "itemListElement": []}
+            </script>
+            <script>window.__STATE__ = {"item": {"price": 19.9}}</script>
+        """
+        assert scraper.extract_price_jsonld(html) is None
+
+    def test_jsonld_reads_price_from_later_block(self, scraper):
+        """Test that every JSON-LD block is checked for an offer price"""
+        html = """
+            <script type="application/ld+json">
+                {"@type": "BreadcrumbList", "itemListElement": []}
+            </script>
+            <script type="application/ld+json">
+                {"@type": "Product", "offers": {"@type": "Offer", "price": "89.5"}}
+            </script>
+        """
+        assert scraper.extract_price_jsonld(html) == 89.50
+
+    def test_returns_none_when_no_selector_matches(self, scraper):
+        """Test that pages without price markup yield None"""
+        html = "<html><body><p>Nada por aqui</p></body></html>"
+        assert scraper.extract_price_from_html(html, scraper.get_price_selectors()) is None
+
+
+class TestParsePriceText:
+    """Test suite for price text parsing"""
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = MercadoLivreScraper()
+        yield scraper
+        scraper.close()
+
+    @pytest.mark.parametrize("text, expected", [
+        ("R$ 1.234,56", 1234.56),
+        ("R$ 1 234,56", 1234.56),
+        ("$1,234.56", 1234.56),
+        ("€1.234,56", 1234.56),
+        ("1234.56 USD", 1234.56),
+        ("$1,234.56 - $2,000.00", 1234.56),
+        ("por R$ 79,99", 79.99),
+    ])
+    def test_parses_common_formats(self, scraper, text, expected):
+        """Test parsing of US, European and Brazilian price formats"""
+        assert scraper.parse_price_text(text) == expected
+
+    @pytest.mark.parametrize("text, expected", [
+        ("1299", 1299.0),
+        ("1.299", 1299.0),
+        ("1.299,90", 1299.90),
+        ("1.234.567,89", 1234567.89),
+        ("12.50", 12.50),
+    ])
+    def test_parses_bare_andes_numbers(self, scraper, text, expected):
+        """Test the regex-free path for bare Brazilian numbers, including whole prices"""
+        assert scraper.parse_price_text(text) == expected
+
+    @pytest.mark.parametrize("text", ["249 90", "12 34", "0 722", "3,4 4", "35, 35 ", "98 .11", "85. 227"])
+    def test_rejects_non_canonical_grouping(self, scraper, text):
+        """Test that stray spaces and malformed groups aren't joined into one number"""
+        assert scraper.parse_price_text(text) is None
+
+    def test_long_leading_group_falls_back_to_regex(self, scraper):
+        """Test that a thousands dot after more than three digits isn't read as grouping"""
+        assert scraper.parse_price_text("5448.860") == 5448.86
+
+    @pytest.mark.parametrize("text", ["", "grátis", "R$ 0,00", "0,00"])
+    def test_rejects_unparseable_text(self, scraper, text):
+        """Test that empty, non-numeric and out-of-range text yield None"""
+        assert scraper.parse_price_text(text) is None
+
+
+class TestAvailability:
+    """Test suite for product availability detection"""
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = MercadoLivreScraper()
+        yield scraper
+        scraper.close()
+
+    def test_available_page(self, scraper):
+        """Test that pages without unavailability phrases are available"""
+        assert scraper.is_product_available("<p>Compre agora</p>") is True
+
+    @pytest.mark.parametrize("html", [
+        "<p>Produto ESGOTADO</p>",
+        "<p>This item is Out Of Stock</p>",
+        "<p>Anúncio pausado pelo vendedor</p>",
+    ])
+    def test_unavailable_page(self, scraper, html):
+        """Test base and Mercado Livre phrases, case-insensitively"""
+        assert scraper.is_product_available(html) is False
+
+    def test_phrase_across_scan_window_boundary(self, scraper):
+        """Test that a phrase split across two scan windows is still found"""
+        window = PhraseMatcher.WINDOW_SIZE
+        html = "x" * (window - 4) + "ESGOTADO" + "x" * 100
+        assert scraper.is_product_available(html) is False
+
+
+class TestExtractCurrency:
+    """Test suite for currency detection"""
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = MercadoLivreScraper()
+        yield scraper
+        scraper.close()
+
+    @pytest.mark.parametrize("html, expected", [
+        ("<span>R$ 10,00</span>", 'BRL'),
+        ("<span>$ 10.00</span> priceCurrency: EUR", 'EUR'),
+        ("<span>C$ 10.00</span>", 'CAD'),
+        ("<span>£10</span>", 'GBP'),
+    ])
+    def test_detects_codes_before_symbols(self, scraper, html, expected):
+        """Test that explicit codes win over symbols found earlier in the page"""
+        assert scraper.extract_currency(html) == expected
+
+    def test_uses_default_when_nothing_found(self, scraper):
+        """Test fallback when the page sample has no currency marker"""
+        assert scraper.extract_currency("<p>sem preço</p>", default='XYZ') == 'XYZ'
+
+    def test_only_checks_first_5kb(self, scraper):
+        """Test that markers beyond the sample window are ignored"""
+        assert scraper.extract_currency("x" * 5000 + "USD", default='BRL') == 'BRL'
+
+
+class TestScanPage:
+    """Test suite for the fused availability and currency scan"""
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = MercadoLivreScraper()
+        yield scraper
+        scraper.close()
+
+    @pytest.mark.parametrize("html", [
+        "<span>R$ 10,00</span>",
+        "<span>$ 10.00</span> priceCurrency: EUR <p>Esgotado</p>",
+        "<span>C$ 10.00</span> Out of stock",
+        "<p>sem preço</p>",
+        "<span>A$ 5</span>" + "x" * 5000 + "USD publicação pausada",
+        "<p>İstanbul</p>" + "x" * 4980 + "USD",
+    ])
+    def test_matches_separate_checks(self, scraper, html):
+        """Test that one scan agrees with is_product_available and extract_currency"""
+        assert scraper.scan_page(html, default_currency='XYZ') == (
+            scraper.is_product_available(html),
+            scraper.extract_currency(html, default='XYZ'),
+        )
+
+    def test_currency_tokens_are_case_sensitive(self, scraper):
+        """Test that lowercase words are not mistaken for currency codes"""
+        assert scraper.scan_page("<p>usd eur brl</p>", default_currency='XYZ') == (True, 'XYZ')
+
+    def test_currency_after_length_changing_character(self, scraper):
+        """Test that characters whose lowercase is longer don't shift later tokens"""
+        assert scraper.scan_page('<p>İ</p> US$ 10') == (True, 'USD')
+
+    def test_phrase_beyond_currency_sample(self, scraper):
+        """Test that phrases past the sniffed head are still found"""
+        html = "<span>€ 10</span>" + "x" * (PhraseMatcher.WINDOW_SIZE * 2) + "ESGOTADO"
+        assert scraper.scan_page(html) == (False, 'EUR')
@@ -1,4 +1,5 @@
 import json
+import subprocess
 import sys
 import os
 
@@ -23,6 +24,15 @@ def test_lambda_handler():
     assert 'message' in json.loads(response['body'])
     assert 'timestamp' in json.loads(response['body'])
 
+def test_default_path_does_not_import_scrapers():
+    """Test that importing the handler leaves the scraper stack and psutil unloaded"""
+    root = os.path.join(os.path.dirname(__file__), '..', '..')
+    code = (
+        "import sys, lambda_function; "
+        "assert not {'scrapers.base', 'httpx', 'selectolax', 'psutil'} & set(sys.modules)"
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+
 if __name__ == '__main__':
     test_lambda_handler()
     print("✅ All tests passed")
\ No newline at end of file
@@ -0,0 +1,300 @@
+import gc
+import io
+import json
+import logging
+import sys
+import weakref
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+import utils.logger
+from utils.logger import JsonFormatter, MetricsLogger, StructuredLogger, flush_logs, get_logger
+
+
+class TestJsonFormatter:
+    """Test suite for JsonFormatter"""
+
+    def _record(self, message, *args, **extra_fields):
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, message, args, None)
+        if extra_fields:
+            record.extra_fields = extra_fields
+        return record
+
+    def test_formats_record_as_json(self):
+        """Test that the record is rendered as one JSON object with extra fields merged in"""
+        line = JsonFormatter().format(self._record("Fetched %s in %dms", "url", 12, store="ml"))
+        data = json.loads(line)
+
+        assert data["level"] == "INFO"
+        assert data["logger"] == "test"
+        assert data["message"] == "Fetched url in 12ms"
+        assert data["store"] == "ml"
+        assert data["timestamp"].endswith("Z")
+
+    def test_serializes_non_str_keys_and_unicode(self):
+        """Test parity with json.dumps for integer keys and non-ASCII text"""
+        line = JsonFormatter().format(self._record("preço", counts={1: 2}))
+        data = json.loads(line)
+
+        assert data["message"] == "preço"
+        assert data["counts"] == {"1": 2}
+
+    def test_serializes_datetimes_as_utc_iso8601(self):
+        """Test that datetime fields render as ISO 8601 UTC, naive ones assumed UTC"""
+        line = JsonFormatter().format(self._record(
+            "metrics",
+            aware=datetime(2024, 1, 2, 3, 4, 5, 600000, tzinfo=timezone.utc),
+            naive=datetime(2024, 1, 2, 3, 4, 5),
+        ))
+        data = json.loads(line)
+
+        assert data["aware"] == "2024-01-02T03:04:05.600000Z"
+        assert data["naive"] == "2024-01-02T03:04:05Z"
+
+    def test_traceback_is_released_after_formatting(self):
+        """Test that the record drops the exception once it is rendered, so the raising frame is collected"""
+        class Marker:
+            pass
+
+        refs = []
+
+        def fail():
+            marker = Marker()
+            refs.append(weakref.ref(marker))
+            raise ValueError("boom")
+
+        try:
+            fail()
+        except ValueError:
+            record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+
+        formatter = JsonFormatter()
+        data = json.loads(formatter.format(record))
+        gc.collect()
+
+        assert refs[0]() is None
+        assert data["exception"]["type"] == "ValueError"
+        assert data["exception"]["traceback"].startswith("Traceback (most recent call last):")
+        assert 'raise ValueError("boom")' in data["exception"]["traceback"]
+        assert record.exc_info is None
+        assert record.exc_text == data["exception"]["traceback"]
+        # Later formatters still see the rendered exception
+        assert json.loads(formatter.format(record))["exception"] == data["exception"]
+        assert data["exception"]["traceback"] in logging.Formatter().format(record)
+
+    def test_timestamp_is_utc_iso8601_from_record_time(self):
+        """Test that the cached per-second prefix still renders each record's own time"""
+        formatter = JsonFormatter()
+        first = self._record("a")
+        first.created = 1700000000.25
+        second = self._record("b")
+        second.created = 1700000000.5
+
+        assert formatter.formatTime(first) == "2023-11-14T22:13:20.250000Z"
+        assert formatter.formatTime(second) == "2023-11-14T22:13:20.500000Z"
+
+
+class TestGetLogger:
+    """Test suite for get_logger"""
+
+    def test_context_free_loggers_are_shared(self):
+        """Test that module-level loggers are built once per name"""
+        assert get_logger("test-shared") is get_logger("test-shared")
+        assert get_logger("test-shared") is not get_logger("test-other")
+
+    def test_lambda_context_gets_its_own_logger(self):
+        """Test that a Lambda context yields a fresh logger carrying its fields"""
+        context = type('Context', (), {
+            'aws_request_id': 'req-1',
+            'function_name': 'fn',
+            'function_version': '$LATEST',
+            'memory_limit_in_mb': 512,
+        })()
+
+        logger = get_logger("test-shared", context)
+
+        assert logger is not get_logger("test-shared")
+        assert logger.context["request_id"] == "req-1"
+
+
+class TestStructuredLogger:
+    """Test suite for StructuredLogger"""
+
+    def test_filtered_levels_skip_building_fields(self):
+        """Test that calls below the logger's level return before merging context"""
+        logger = StructuredLogger("test-level", {"request_id": "req-1"})
+        logger._level = logging.WARNING
+
+        with patch.object(StructuredLogger, "_add_context") as mock_add_context, \
+                patch.object(logger.logger, "info") as mock_info:
+            logger.info("skipped", rows=1)
+            logger.debug("skipped")
+
+        mock_add_context.assert_not_called()
+        mock_info.assert_not_called()
+        assert not logger.isEnabledFor(logging.INFO)
+        assert logger.isEnabledFor(logging.ERROR)
+
+    def test_call_fields_override_context(self):
+        """Test that extra fields layered over the context win and reach the JSON line"""
+        logger = StructuredLogger("test-level", {"request_id": "req-1", "store": "ml"})
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "m", None, None)
+        record.extra_fields = logger._add_context({"store": "amazon"})
+
+        data = json.loads(JsonFormatter().format(record))
+
+        assert data["request_id"] == "req-1"
+        assert data["store"] == "amazon"
+        assert StructuredLogger("test-level")._add_context({"rows": 1}) == {"rows": 1}
+
+    def test_enabled_levels_carry_context(self):
+        """Test that enabled calls merge the logger context with the extra fields"""
+        logger = StructuredLogger("test-level", {"request_id": "req-1"})
+        logger._level = logging.INFO
+
+        with patch.object(logger.logger, "warning") as mock_warning:
+            logger.warning("retrying %d", 2, attempt=2)
+
+        mock_warning.assert_called_once_with(
+            "retrying %d", 2, extra={"extra_fields": {"request_id": "req-1", "attempt": 2}}
+        )
+
+
+class TestMetricsLogger:
+    """Test suite for MetricsLogger"""
+
+    @patch('utils.logger.time.monotonic')
+    def test_memory_readings_reuse_recent_sample(self, mock_monotonic):
+        """Test that readings within the sample TTL don't query the process again"""
+        metrics = MetricsLogger(get_logger("test-metrics"))
+        metrics._process = MagicMock()
+        metrics._process.memory_info.return_value.rss = 256 * 1024 * 1024
+        metrics._total_memory = 1024 * 1024 * 1024
+
+        mock_monotonic.return_value = 10.0
+        metrics.record_memory_usage()
+        mock_monotonic.return_value = 10.05
+        metrics.record_memory_usage()
+
+        assert metrics._process.memory_info.call_count == 1
+        assert metrics.metrics["memory_used_mb"] == 256
+        assert metrics.metrics["memory_percent"] == 25
+
+        mock_monotonic.return_value = 10.2
+        metrics.record_memory_usage()
+        assert metrics._process.memory_info.call_count == 2
+
+    def test_execution_timestamp_is_iso8601_string(self):
+        """Test that execution_timestamp stays a plain ISO 8601 UTC string"""
+        metrics = MetricsLogger(get_logger("test-metrics"))
+        metrics.record_execution_metrics()
+
+        timestamp = metrics.metrics["execution_timestamp"]
+        assert isinstance(timestamp, str)
+        assert timestamp.endswith("Z")
+        assert datetime.fromisoformat(timestamp[:-1] + "+00:00").tzinfo == timezone.utc
+        json.dumps(metrics.metrics)
+
+    def test_record_scraping_metrics(self):
+        """Test that a scraping batch records its per-store metrics and bumps the totals"""
+        metrics = MetricsLogger(get_logger("test-metrics"))
+
+        metrics.record_scraping_metrics("ml", 4, 3, 1, 2.5)
+        metrics.record_scraping_metrics("ml", 2, 2, 0, 1.0)
+
+        assert metrics.metrics == {
+            "ml_products_processed": 2,
+            "ml_success_count": 2,
+            "ml_failure_count": 0,
+            "ml_duration_seconds": 1.0,
+            "ml_success_rate": 1.0,
+        }
+        assert metrics.counters == {
+            "total_products_processed": 6,
+            "successful_operations": 5,
+            "failed_operations": 1,
+        }
+
+    @patch('utils.logger.time.perf_counter_ns')
+    def test_timers_use_monotonic_clock(self, mock_perf_counter_ns):
+        """Test that a timer measures perf_counter_ns() ticks and is cleared when ended"""
+        metrics = MetricsLogger(get_logger("test-metrics"))
+
+        mock_perf_counter_ns.return_value = 1_000_000_000
+        metrics.start_timer("scrape")
+        mock_perf_counter_ns.return_value = 3_500_000_000
+
+        assert metrics.end_timer("scrape") == 2.5
+        assert metrics.metrics["scrape_duration_seconds"] == 2.5
+        assert "scrape" not in metrics.timers
+        assert metrics.end_timer("scrape") == 0.0
+
+    def test_timing_and_memory_can_be_disabled(self):
+        """Test that disabled timers are no-ops and log_metrics skips the memory reading"""
+        metrics = MetricsLogger(get_logger("test-metrics"), enable_timing=False, enable_memory=False)
+
+        metrics.start_timer("scrape")
+        assert metrics.end_timer("scrape") == 0.0
+        assert metrics.timers == {}
+
+        with patch.object(MetricsLogger, "record_memory_usage") as mock_memory:
+            metrics.log_metrics()
+        mock_memory.assert_not_called()
+        assert "scrape_duration_seconds" not in metrics.metrics
+
+
+class TestQueuedLogging:
+    """Test suite for the queue-backed log handler"""
+
+    def test_records_are_written_by_listener_on_flush(self):
+        """Test that queued records keep their args and exception info until written"""
+        stream = io.StringIO()
+        previous = utils.logger._STREAM_HANDLER.setStream(stream)
+        try:
+            logger = StructuredLogger("test-queued")
+            args = ["a"]
+            logger.info("items %s", args, rows=1)
+            args.append("b")
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("failed")
+            flush_logs()
+        finally:
+            utils.logger._STREAM_HANDLER.setStream(previous)
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert lines[0]["message"] == "items ['a']"
+        assert lines[0]["rows"] == 1
+        assert lines[1]["message"] == "failed"
+        assert lines[1]["exception"]["type"] == "ValueError"
+
+    def test_stream_is_only_flushed_for_errors(self):
+        """Test that the buffered handler leaves INFO lines in the buffer and flushes errors"""
+        stream = MagicMock()
+        handler = utils.logger._BufferedStreamHandler(stream)
+        handler.setFormatter(JsonFormatter())
+
+        handler.handle(logging.LogRecord("test", logging.INFO, __file__, 1, "a", None, None))
+        stream.flush.assert_not_called()
+
+        handler.handle(logging.LogRecord("test", logging.ERROR, __file__, 1, "b", None, None))
+        stream.flush.assert_called_once()
+        assert stream.write.call_count == 2
+
+    def test_extra_fields_are_snapshotted_at_log_time(self):
+        """Test that fields and context changed after the log call don't reach the line"""
+        stream = io.StringIO()
+        previous = utils.logger._STREAM_HANDLER.setStream(stream)
+        try:
+            logger = StructuredLogger("test-queued", context={"stage": "fetch"})
+            skus = ["a"]
+            logger.info("batch", skus=skus)
+            skus.append("b")
+            logger.context["stage"] = "parse"
+            flush_logs()
+        finally:
+            utils.logger._STREAM_HANDLER.setStream(previous)
+
+        line = json.loads(stream.getvalue().splitlines()[0])
+        assert line["skus"] == ["a"]
+        assert line["stage"] == "fetch"
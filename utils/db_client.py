@@ -1,22 +1,251 @@
 import os
 import time
-import psycopg2
-from psycopg2 import pool, extras
-from typing import List, Dict, Any, Optional
-from contextlib import contextmanager
+import atexit
+import random
+import asyncio
+import threading
+import logging
+import uuid
+import psycopg
+from psycopg import sql
+from psycopg.adapt import AdaptersMap, Loader
+from psycopg.conninfo import make_conninfo
+from psycopg.pq import Format
+from psycopg.rows import dict_row, namedtuple_row
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple, TYPE_CHECKING
+from contextlib import contextmanager, asynccontextmanager
 from datetime import datetime
 from utils.logger import get_logger
 
-# Module-level connection pool (persists across Lambda invocations)
-_connection_pool = None
+if TYPE_CHECKING:
+    from scrapers.base import ScrapingResult
+
+# Module-level connection pools keyed by DSN (persist across Lambda invocations)
+_POOLS: Dict[str, "CachingConnectionPool"] = {}
+# Open DatabaseClients per DSN; close() only closes a pool once its last client is closed
+_POOL_CLIENTS: Dict[str, int] = {}
+# Guards pool creation and the client counts
+_POOLS_LOCK = threading.Lock()
+# Async pools for concurrent scraping keyed by DSN, each with the event loop it was opened on
+_ASYNC_POOLS: Dict[str, Tuple[AsyncConnectionPool, asyncio.AbstractEventLoop]] = {}
 logger = get_logger(__name__)
 
+# TCP keepalives so connections idling in a frozen Lambda environment are
+# detected as dead instead of silently dropped by NAT
+_KEEPALIVE_KWARGS = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
+
+# Upper bound for a single retry backoff, in seconds
+_MAX_RETRY_WAIT = 5.0
+
+# Scrape bookkeeping for one product link: successful scrapes update the price
+# stats and reset the error count, failed ones (NULL price) only bump it.
+_PRODUCT_LINK_SCRAPE_SET = """
+    last_price = COALESCE(v.price, pl.last_price),
+    lowest_price_seen = LEAST(pl.lowest_price_seen, v.price),
+    highest_price_seen = GREATEST(pl.highest_price_seen, v.price),
+    last_checked_at = now(),
+    scrape_error_count = CASE
+        WHEN v.price IS NULL THEN pl.scrape_error_count + 1
+        ELSE 0
+    END,
+    updated_at = now()
+"""
+
+# Whole batch in one statement, for _execute_values
+_UPDATE_PRODUCT_LINKS_SQL = sql.SQL(f"""
+    UPDATE product_links AS pl
+    SET {_PRODUCT_LINK_SCRAPE_SET}
+    FROM (VALUES {{values}}) AS v(id, price)
+    WHERE pl.id = v.id
+""")
+_UPDATE_PRODUCT_LINKS_TEMPLATE = sql.SQL("(%s::uuid, %s::numeric)")
+# Rows per UPDATE statement, keeping the bind parameters well under Postgres' 65535 limit
+_BULK_UPDATE_PAGE_SIZE = 500
+
+# One product link per statement, for pipeline mode and prepared single writes
+_UPDATE_PRODUCT_LINK_SQL = f"""
+    UPDATE product_links AS pl
+    SET {_PRODUCT_LINK_SCRAPE_SET}
+    FROM (VALUES (%s::uuid, %s::numeric)) AS v(id, price)
+    WHERE pl.id = v.id
+"""
+
+_PRICE_HISTORY_COLUMNS = (
+    'product_link_id',
+    'price',
+    'original_price',
+    'discount_percentage',
+    'currency',
+    'was_available',
+    'scrape_source',
+    'response_time_ms',
+)
+_INSERT_PRICE_HISTORY_ROW_SQL = (
+    f"INSERT INTO price_history ({', '.join(_PRICE_HISTORY_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * len(_PRICE_HISTORY_COLUMNS))})"
+)
+
+_COPY_PRICE_HISTORY_SQL = (
+    f"COPY price_history ({', '.join(_PRICE_HISTORY_COLUMNS)}) FROM STDIN"
+)
+# Batches larger than this go through COPY instead of a multi-row INSERT
+_COPY_THRESHOLD = 50
+
+# Work list for a scrape run, least recently checked first
+_ACTIVE_PRODUCT_LINKS_SQL = """
+    SELECT
+        pl.id,
+        pl.url,
+        pl.store,
+        pl.product_identifier,
+        pl.last_price,
+        pl.scrape_error_count
+    FROM product_links pl
+    JOIN products p ON pl.product_id = p.id
+    WHERE pl.is_active = true
+    AND p.is_active = true
+    ORDER BY pl.last_checked_at ASC NULLS FIRST
+"""
+
+class _UUIDStrLoader(Loader):
+    """Load uuid columns as str, as psycopg2 did."""
+
+    def load(self, data):
+        return bytes(data).decode()
+
+class _UUIDStrBinaryLoader(Loader):
+    """Load binary uuid columns as str, as psycopg2 did."""
+
+    format = Format.BINARY
+
+    def load(self, data):
+        return str(uuid.UUID(bytes=bytes(data)))
+
+# Adapters shared by every pooled connection. IDs stay plain strings, so they
+# can be passed around, compared and serialized as before the psycopg 3 move.
+_ADAPTERS = AdaptersMap(psycopg.adapters)
+_ADAPTERS.register_loader("uuid", _UUIDStrLoader)
+_ADAPTERS.register_loader("uuid", _UUIDStrBinaryLoader)
+
+# Connection settings for the sync pool. Statements are prepared server-side
+# from their second execution on, so the hot scraper writes skip parsing and
+# planning without any hand-written PREPARE.
+_CONNECTION_KWARGS = {
+    "row_factory": namedtuple_row,
+    "prepare_threshold": 1,
+    "context": _ADAPTERS,
+}
+
+class CachingConnectionPool(ConnectionPool):
+    """
+    Thread-safe connection pool that only checks connections that sat idle.
+
+    Returned connections stay open (up to max_size) and on checkout a
+    connection is only checked with a round trip to the server if it has sat
+    idle for longer than idle_ttl; recently used ones are handed out as is.
+    """
+
+    def __init__(self, conninfo: str = "", *, idle_ttl: float = 60.0, **kwargs):
+        self.idle_ttl = idle_ttl
+        # id(conn) -> time.monotonic() when it went idle
+        self._returned_at: Dict[int, float] = {}
+        super().__init__(conninfo, check=self._check_idle, **kwargs)
+
+    def putconn(self, conn) -> None:
+        """Return a connection to the pool, noting when it went idle."""
+        self._returned_at[id(conn)] = time.monotonic()
+        super().putconn(conn)
+
+    def _check_idle(self, conn) -> None:
+        """Check a connection on checkout if it went stale while idle."""
+        returned_at = self._returned_at.pop(id(conn), None)
+        if returned_at is None or time.monotonic() - returned_at <= self.idle_ttl:
+            return
+        try:
+            self.check_connection(conn)
+        except psycopg.Error:
+            # The pool discards the connection and hands out another one
+            logger.warning("Discarding stale pooled connection", extra={
+                "idle_seconds": round(time.monotonic() - returned_at, 1)
+            })
+            raise
+
+def _close_connection_pool(database_url: Optional[str] = None):
+    """
+    Close every connection in a module-level pool and drop it.
+
+    Closing explicitly releases the sockets right away instead of leaving
+    them to garbage collection, which may not run before the Lambda
+    environment is frozen or shut down.
+
+    Args:
+        database_url: DSN whose pool to close; all pools if omitted
+    """
+    database_urls = list(_POOLS) if database_url is None else [database_url]
+    for url in database_urls:
+        old_pool = _POOLS.pop(url, None)
+        if old_pool is not None and not old_pool.closed:
+            try:
+                old_pool.close()
+            except Exception as e:
+                logger.warning("Failed to close connection pool", extra={
+                    "error": str(e)
+                })
+
+atexit.register(_close_connection_pool)
+
+def _close_async_pool(async_pool: AsyncConnectionPool, loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Close an async pool from synchronous code, on the loop that opened it.
+
+    The pool's workers and connections belong to that loop, so the close
+    runs there: scheduled if the loop is running in another thread, run to
+    completion if it is idle. A pool whose loop has already closed can no
+    longer be closed cleanly, which is why batches should end with
+    DatabaseClient.aclose().
+    """
+    if async_pool.closed:
+        return
+    try:
+        if loop.is_closed():
+            logger.warning("Async connection pool outlived its event loop; call aclose() before the loop ends")
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(async_pool.close(), loop)
+        else:
+            loop.run_until_complete(async_pool.close())
+    except Exception as e:
+        logger.warning("Failed to close async connection pool", extra={
+            "error": str(e)
+        })
+
+def _close_async_connection_pool(database_url: Optional[str] = None):
+    """
+    Close and drop module-level async pools.
+
+    Args:
+        database_url: DSN whose async pool to close; all async pools if omitted
+    """
+    database_urls = list(_ASYNC_POOLS) if database_url is None else [database_url]
+    for url in database_urls:
+        entry = _ASYNC_POOLS.pop(url, None)
+        if entry is not None:
+            _close_async_pool(*entry)
+
+atexit.register(_close_async_connection_pool)
+
 class DatabaseClient:
     """
     PostgresSQL database client optimized for AWS Lambda.
 
     Features:
     - Connection pooling for efficient resource usage
+    - Async connection pool for overlapping queries from concurrent coroutines
     - Automatic retry logic with exponential backoff
     - Context managers for safe connection handling
     - Structured logging for all operations
@@ -36,28 +265,43 @@ class DatabaseClient:
         if not self.database_url:
             raise ValueError("DATABASE_URL environment variable is required")
 
+        # Parsed once and reused whenever the pool is rebuilt
+        self._conninfo = make_conninfo(self.database_url, **_KEEPALIVE_KWARGS)
+
         self._ensure_connection_pool()
+        with _POOLS_LOCK:
+            _POOL_CLIENTS[self.database_url] = _POOL_CLIENTS.get(self.database_url, 0) + 1
+        self._closed = False
         logger.info("DatabaseClient initialized", extra={
             "max_retries": max_retries
         })
     
-    def _ensure_connection_pool(self):
+    def _ensure_connection_pool(self) -> "CachingConnectionPool":
         """
         Ensure connection pool exists and is healthy.
 
         Lambda functions reuse execution environments, so we create a module-level connection pool that persists across invocations. This significantly reduces cold start time.
+        Pools are keyed by DSN, so clients for different databases don't share or reset each other's pool.
+        The pool is looked up on every lease rather than held by the client, so a pool
+        closed by another client's retry is replaced instead of breaking this one.
         """
 
-        global _connection_pool
-        
-        if _connection_pool is None:
+        conn_pool = _POOLS.get(self.database_url)
+        if conn_pool is not None and not conn_pool.closed:
+            return conn_pool
+
+        with _POOLS_LOCK:
+            conn_pool = _POOLS.get(self.database_url)
+            if conn_pool is not None and not conn_pool.closed:
+                return conn_pool
             try:
                 logger.info("Creating new database connection pool")
-                _connection_pool = psycopg2.pool.SimpleConnectionPool(
-                    minconn = 1,
-                    maxconn = 5,
-                    dsn = self.database_url,
-                    cursor_factory=extras.RealDictCursor
+                conn_pool = _POOLS[self.database_url] = CachingConnectionPool(
+                    self._conninfo,
+                    min_size=2,
+                    max_size=10,
+                    kwargs=_CONNECTION_KWARGS,
+                    open=True
                 )
                 logger.info("Connection pool created successfully")
             except Exception as e:
@@ -65,12 +309,27 @@ class DatabaseClient:
                     "error": str(e)
                 })
                 raise
+        return conn_pool
+
+    @property
+    def _pool(self) -> "CachingConnectionPool":
+        """The current pool for this client's DSN."""
+        return self._ensure_connection_pool()
     
     @contextmanager
-    def get_connection(self):
+    def get_connection(self, readonly: bool = False, row_factory=None):
         """
         Context manager for database connections.
 
+        Cursors return rows as named tuples by default, which are cheaper to
+        build than dicts on large fetches; pass row_factory (e.g.
+        psycopg.rows.dict_row) to get another row type for this lease.
+
+        Args:
+            readonly: Run in autocommit mode for SELECT-only work, skipping
+                the implicit BEGIN and the COMMIT/ROLLBACK round trips
+            row_factory: Row factory for conn.cursor() during this lease
+
         Yields:
             A database connection from the pool
 
@@ -80,12 +339,24 @@ class DatabaseClient:
                     cur.execute("SELECT * FROM products")
         """
         conn = None
+        prev_autocommit = None
+        prev_row_factory = None
+        # The connection goes back to the pool it came from, even if the
+        # shared pool is replaced while it is leased
+        conn_pool = self._ensure_connection_pool()
         try:
-            conn = _connection_pool.getconn()
+            conn = conn_pool.getconn()
+            if readonly:
+                prev_autocommit = conn.autocommit
+                conn.autocommit = True
+            if row_factory is not None:
+                prev_row_factory = conn.row_factory
+                conn.row_factory = row_factory
             yield conn
-            conn.commit()
+            if not readonly:
+                conn.commit()
         except Exception as e:
-            if conn:
+            if conn and not readonly:
                 conn.rollback()
             logger.error("Database operation failed", extra={
                 "error": str(e)
@@ -93,11 +364,480 @@ class DatabaseClient:
             raise
         finally:
             if conn:
-                _connection_pool.putconn(conn)
+                if readonly and prev_autocommit is not None:
+                    conn.autocommit = prev_autocommit
+                if row_factory is not None:
+                    conn.row_factory = prev_row_factory
+                conn_pool.putconn(conn)
+
+    @contextmanager
+    def session(self, row_factory=None):
+        """
+        Lease one connection and cursor for several statements in one transaction.
+
+        Shorthand for a get_connection() block wrapping a single cursor, for
+        flows such as "update the product link, then insert its price" that
+        would otherwise take a lease (and a commit) per statement. Commits
+        once on success and rolls back on error; use commit_and_begin() on
+        cur.connection to split the work into several transactions.
+
+        Args:
+            row_factory: Row factory for this session's cursor
+
+        Yields:
+            A cursor on a pooled connection
+
+        Example:
+            with db_client.session() as cur:
+                cur.execute("UPDATE product_links SET ...")
+                cur.execute("INSERT INTO price_history ...")
+        """
+        with self.get_connection(row_factory=row_factory) as conn:
+            with conn.cursor() as cur:
+                yield cur
+
+    def run_many(self, query: str, params_iter: Iterable[Sequence[Any]]) -> int:
+        """
+        Execute one statement for each parameter set on a single cursor and transaction.
+
+        Avoids opening a connection lease and a cursor per row when the same
+        statement is run in a loop. Not retried, since params_iter may be a
+        one-shot iterator.
+
+        Args:
+            query: SQL statement with %s placeholders
+            params_iter: Parameter tuples, one per execution
+
+        Returns:
+            Total number of rows affected
+        """
+        affected = 0
+        with self.session() as cur:
+            for params in params_iter:
+                cur.execute(query, params)
+                affected += max(cur.rowcount, 0)
+        return affected
+
+    def iter_active_product_links(self, batch: int = 500) -> Iterator[Tuple[Any, ...]]:
+        """
+        Stream the active product links to scrape, least recently checked first.
+
+        Uses a named (server-side) cursor, so rows are fetched from Postgres
+        `batch` at a time instead of materializing the whole work list, and
+        the first links can be scraped while the rest are still being fetched.
+        Rows come back in binary format, which skips text parsing of the
+        uuid and numeric columns.
+        The connection stays checked out until the generator is exhausted or
+        closed.
+
+        Args:
+            batch: Rows fetched per round trip
+
+        Yields:
+            Product link rows as named tuples with the fields id, url, store,
+            product_identifier, last_price and scrape_error_count
+        """
+        with self.get_connection() as conn:
+            with conn.cursor(name="active_product_links", binary=True) as cur:
+                cur.itersize = batch
+                cur.execute(_ACTIVE_PRODUCT_LINKS_SQL)
+                yield from cur
+
+    def close(self) -> None:
+        """
+        Release this client's hold on its database's connection pool.
+
+        The pool is shared by every DatabaseClient for the same DSN, so its
+        connections are only closed when the last open client is closed;
+        the next client created opens a new pool. The same goes for the async
+        pool. All pools are also closed at interpreter exit. Calling close()
+        again is a no-op.
+        """
+        with _POOLS_LOCK:
+            if self._closed:
+                return
+            self._closed = True
+            remaining = _POOL_CLIENTS.get(self.database_url, 1) - 1
+            if remaining > 0:
+                _POOL_CLIENTS[self.database_url] = remaining
+                return
+            _POOL_CLIENTS.pop(self.database_url, None)
+        _close_connection_pool(self.database_url)
+        _close_async_connection_pool(self.database_url)
+
+    @staticmethod
+    def commit_and_begin(conn) -> None:
+        """
+        Commit the current transaction and open the next one in one round trip.
+
+        For splitting work into several transactions within a single
+        get_connection() lease; the lease itself still ends with a regular
+        commit. No-op on autocommit connections.
+
+        Example:
+            with db_client.get_connection() as conn:
+                for batch in batches:
+                    write(conn, batch)
+                    db_client.commit_and_begin(conn)
+        """
+        if not conn.autocommit:
+            with conn.cursor() as cur:
+                # Never prepared: a prepared statement can't hold two commands
+                cur.execute("COMMIT; BEGIN", prepare=False)
+
+    @staticmethod
+    def rollback_and_begin(conn) -> None:
+        """
+        Roll back the current transaction and open the next one in one round trip.
+
+        No-op on autocommit connections.
+        """
+        if not conn.autocommit:
+            with conn.cursor() as cur:
+                cur.execute("ROLLBACK; BEGIN", prepare=False)
+
+    async def _ensure_async_connection_pool(self) -> AsyncConnectionPool:
+        """
+        Ensure the async connection pool exists for the running event loop.
+
+        The pool's connections belong to the loop it was opened on, and each
+        invocation that runs asyncio.run() gets a fresh loop, so the pool is
+        recreated whenever the loop changes. The previous loop's pool is
+        closed first where that loop still allows it; see aclose().
+        """
+
+        loop = asyncio.get_running_loop()
+        async_pool, pool_loop = _ASYNC_POOLS.get(self.database_url, (None, None))
+        if async_pool is None or pool_loop is not loop:
+            if async_pool is not None:
+                _close_async_pool(async_pool, pool_loop)
+            try:
+                logger.info("Creating new async database connection pool")
+                async_pool = AsyncConnectionPool(
+                    conninfo=self._conninfo,
+                    min_size=1,
+                    max_size=10,
+                    kwargs={"row_factory": dict_row, "context": _ADAPTERS},
+                    open=False
+                )
+                await async_pool.open()
+                _ASYNC_POOLS[self.database_url] = (async_pool, loop)
+                logger.info("Async connection pool created successfully")
+            except Exception as e:
+                logger.error("Failed to create async connection pool", extra={
+                    "error": str(e)
+                })
+                raise
+
+        return async_pool
+
+    async def aclose(self) -> None:
+        """
+        Close the async pool opened on the running event loop.
+
+        Required for every event loop that used async_connection() or
+        async_record_scrape_results(): await it before the loop ends,
+        typically in a finally block at the end of the coroutine passed to
+        asyncio.run(). Once the loop is closed the pool's connections can no
+        longer be closed cleanly; they stay open until the process exits, and
+        the next loop logs a warning when it replaces the pool.
+
+        Example:
+            async def run_batch(results):
+                try:
+                    await db_client.async_record_scrape_results(results)
+                finally:
+                    await db_client.aclose()
+        """
+        async_pool, pool_loop = _ASYNC_POOLS.get(self.database_url, (None, None))
+        if async_pool is None or pool_loop is not asyncio.get_running_loop():
+            return
+        del _ASYNC_POOLS[self.database_url]
+        try:
+            await async_pool.close()
+        except Exception as e:
+            logger.warning("Failed to close async connection pool", extra={
+                "error": str(e)
+            })
+
+    @asynccontextmanager
+    async def async_connection(self):
+        """
+        Async context manager for database connections.
+
+        The pool commits when the block exits normally and rolls back if it
+        raises, so coroutines running under asyncio.gather() can each hold
+        their own connection without blocking one another.
+
+        The pool belongs to the running event loop; await aclose() before
+        the loop ends.
+
+        Yields:
+            A psycopg AsyncConnection from the pool, returning rows as dicts
+
+        Example:
+            async def load_products():
+                try:
+                    async with db_client.async_connection() as conn:
+                        cur = await conn.execute("SELECT * FROM products")
+                        return await cur.fetchall()
+                finally:
+                    await db_client.aclose()
+        """
+        async_pool = await self._ensure_async_connection_pool()
+        try:
+            async with async_pool.connection() as conn:
+                yield conn
+        except Exception as e:
+            logger.error("Database operation failed", extra={
+                "error": str(e)
+            })
+            raise
+
+    @staticmethod
+    def _scrape_result_rows(results: Sequence["ScrapingResult"]):
+        """Split scrape results into product_links updates and price_history rows."""
+        link_rows = [(r.product_link_id, r.price) for r in results]
+        history_rows = [
+            (
+                r.product_link_id,
+                r.price,
+                r.original_price,
+                r.discount_percentage,
+                r.currency,
+                r.was_available,
+                r.scrape_source,
+                r.response_time_ms
+            )
+            for r in results
+            if r.price is not None
+        ]
+        return link_rows, history_rows
+
+    @staticmethod
+    def _execute_values(cur, query: sql.SQL, rows: Sequence[tuple], template: sql.Composable,
+                        page_size: int, **parts: sql.Composable) -> None:
+        """
+        Run query once per page of rows, with its {values} placeholder
+        expanded to one template per row, like psycopg2's execute_values().
+        """
+        for start in range(0, len(rows), page_size):
+            page = rows[start:start + page_size]
+            values = sql.SQL(', ').join([template] * len(page))
+            cur.execute(
+                query.format(values=values, **parts),
+                [value for row in page for value in row]
+            )
+
+    @staticmethod
+    def _insert_rows(cur, table: str, columns: Sequence[str], rows: Sequence[tuple], page_size: int) -> None:
+        """Insert rows with multi-row INSERT ... VALUES statements."""
+        DatabaseClient._execute_values(
+            cur,
+            sql.SQL("INSERT INTO {table} ({columns}) VALUES {values}"),
+            rows,
+            sql.SQL("({})").format(sql.SQL(', ').join([sql.Placeholder()] * len(columns))),
+            page_size,
+            table=sql.Identifier(table),
+            columns=sql.SQL(', ').join(map(sql.Identifier, columns))
+        )
+
+    def bulk_insert(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[tuple],
+        page_size: int = 1000
+    ) -> None:
+        """
+        Insert many rows with multi-row INSERT statements.
+
+        Rows are packed into INSERT ... VALUES (...), (...) statements of up
+        to page_size rows each, instead of one INSERT per row.
+
+        Args:
+            table: Table to insert into
+            columns: Column names, in the order of each row's values
+            rows: Row value tuples
+            page_size: Maximum rows per INSERT statement
+
+        Example:
+            db_client.bulk_insert('products', ('user_id', 'name'), [(user_id, 'A'), (user_id, 'B')])
+        """
+        if not rows:
+            return
+
+        def operation():
+            with self.session() as cur:
+                self._insert_rows(cur, table, columns, rows, page_size)
+
+        self._execute_with_retry(operation)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Inserted rows", extra={
+                "table": table,
+                "rows": len(rows)
+            })
+
+    @staticmethod
+    def _copy_price_history(cur, rows: Sequence[tuple]) -> None:
+        """Stream price_history rows through COPY ... FROM STDIN."""
+        with cur.copy(_COPY_PRICE_HISTORY_SQL) as copy:
+            for row in rows:
+                copy.write_row(row)
+
+    def copy_price_history(self, rows: Sequence[tuple]) -> None:
+        """
+        Bulk load price_history rows with the COPY protocol.
+
+        COPY skips per-row SQL parsing entirely, which makes it the fastest
+        path for backfills and large scrape batches.
+
+        Args:
+            rows: Tuples in _PRICE_HISTORY_COLUMNS order
+        """
+        if not rows:
+            return
+
+        def operation():
+            with self.session() as cur:
+                self._copy_price_history(cur, rows)
+
+        self._execute_with_retry(operation)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Copied price history", extra={
+                "rows": len(rows)
+            })
+
+    @staticmethod
+    def _update_product_links(cur, rows: Sequence[Tuple[str, Optional[float]]], page_size: int) -> None:
+        """Apply scrape outcomes to product_links with set-based UPDATEs."""
+        DatabaseClient._execute_values(
+            cur,
+            _UPDATE_PRODUCT_LINKS_SQL,
+            rows,
+            _UPDATE_PRODUCT_LINKS_TEMPLATE,
+            page_size
+        )
+
+    def bulk_update_product_links(self, rows: Sequence[Tuple[str, Optional[float]]]) -> None:
+        """
+        Update product links after a scrape run with set-based UPDATEs.
+
+        Each UPDATE ... FROM (VALUES ...) statement covers up to 500 links,
+        so thousands of links are planned a handful of times instead of once
+        per row.
+
+        Args:
+            rows: (product_link_id, new_price) pairs, at most one per link.
+                A None price records a failed scrape.
+        """
+        if not rows:
+            return
+
+        def operation():
+            with self.session() as cur:
+                self._update_product_links(cur, rows, page_size=_BULK_UPDATE_PAGE_SIZE)
+
+        self._execute_with_retry(operation)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Updated product links", extra={
+                "rows": len(rows)
+            })
+
+    def record_scrape_result(self, result: "ScrapingResult") -> None:
+        """
+        Persist a single scrape result with server-side prepared statements.
+
+        For scrapers that save each product as soon as it is scraped; batches
+        should go through record_scrape_results() instead.
+
+        Args:
+            result: ScrapingResult for one product link
+        """
+        (link_row,), history_rows = self._scrape_result_rows([result])
+
+        def operation():
+            with self.session() as cur:
+                cur.execute(_UPDATE_PRODUCT_LINK_SQL, link_row, prepare=True)
+                for row in history_rows:
+                    cur.execute(_INSERT_PRICE_HISTORY_ROW_SQL, row, prepare=True)
+
+        self._execute_with_retry(operation)
+
+    def record_scrape_results(self, results: Sequence["ScrapingResult"]) -> None:
+        """
+        Persist a batch of scrape results in one transaction.
+
+        The whole batch costs two statements regardless of its size: one
+        UPDATE ... FROM (VALUES ...) for product_links and one multi-row
+        INSERT for price_history, or a COPY for batches over 50 prices.
+        Results without a price only count as a scrape error on their
+        product link.
+
+        Args:
+            results: ScrapingResult objects from a scrape batch, at most one
+                per product link
+        """
+        if not results:
+            return
+
+        link_rows, history_rows = self._scrape_result_rows(results)
+
+        def operation():
+            with self.session() as cur:
+                self._update_product_links(cur, link_rows, page_size=_BULK_UPDATE_PAGE_SIZE)
+                if len(history_rows) > _COPY_THRESHOLD:
+                    self._copy_price_history(cur, history_rows)
+                elif history_rows:
+                    self._insert_rows(
+                        cur,
+                        'price_history',
+                        _PRICE_HISTORY_COLUMNS,
+                        history_rows,
+                        page_size=len(history_rows)
+                    )
+
+        self._execute_with_retry(operation)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Recorded scrape results", extra={
+                "results": len(link_rows),
+                "prices": len(history_rows)
+            })
+
+    async def async_record_scrape_results(self, results: Sequence["ScrapingResult"]) -> None:
+        """
+        Persist a batch of scrape results using psycopg pipeline mode.
+
+        Statements are queued without waiting for each reply and sent in one
+        flush, so a batch of N links costs about one round trip instead of 2N.
+
+        Uses the async pool of the running event loop, so await aclose()
+        before the loop ends (see aclose() for an example).
+
+        Args:
+            results: ScrapingResult objects from a scrape batch
+        """
+        if not results:
+            return
+
+        link_rows, history_rows = self._scrape_result_rows(results)
+
+        async with self.async_connection() as conn:
+            async with conn.pipeline():
+                for row in link_rows:
+                    await conn.execute(_UPDATE_PRODUCT_LINK_SQL, row)
+                for row in history_rows:
+                    await conn.execute(_INSERT_PRICE_HISTORY_ROW_SQL, row)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Recorded scrape results", extra={
+                "results": len(link_rows),
+                "prices": len(history_rows)
+            })
 
     def _execute_with_retry(self, operation, *args, **kwargs):
         """
-        Execute a database operation with exponential backoff retry logic.
+        Execute a database operation with capped, jittered exponential backoff retry logic.
 
         Args:
             operation: function to execute
@@ -114,22 +854,28 @@ class DatabaseClient:
         for attempt in range(self.max_retries):
             try:
                 return operation(*args, **kwargs)
-            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            except (psycopg.OperationalError, psycopg.InterfaceError) as e:
                 last_exception = e
-                wait_time = 2 ** attempt
+                # Full jitter, so clients failing together don't retry in lockstep
+                wait_time = random.uniform(0, min(_MAX_RETRY_WAIT, 2 ** attempt))
 
-                logger.warning(f"Database operation failed, retrying...", extra={
-                    "attempt": attempt + 1,
-                    "max_retries": self.max_retries,
-                    "wait_time": wait_time,
-                    "error": str(e)
-                })
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Database operation failed, retrying (attempt %d/%d)",
+                        attempt + 1, self.max_retries,
+                        extra={
+                            "attempt": attempt + 1,
+                            "max_retries": self.max_retries,
+                            "wait_time": wait_time,
+                            "error": str(e)
+                        }
+                    )
 
                 if attempt < self.max_retries - 1:
                     time.sleep(wait_time)
-                    # Recreate connection pool on connection errors
-                    global _connection_pool
-                    _connection_pool = None
+                    # Recreate connection pool on connection errors; other
+                    # clients on this DSN pick up the new pool on their next lease
+                    _close_connection_pool(self.database_url)
                     self._ensure_connection_pool()
             except Exception as e:
                 #Don't retry on other types of errors (e.g., SQL syntax errors)
@@ -1,89 +1,238 @@
-import json
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import time
-import psutil
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
-import traceback
+from collections import ChainMap, defaultdict
+from typing import Any, DefaultDict, Dict, Mapping, Optional, Tuple
+
+import orjson
+
+# Non-str keys are allowed, as with json.dumps; datetimes render as ISO 8601 UTC
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log line with orjson, which returns bytes."""
+    return orjson.dumps(data, option=_ORJSON_OPTIONS).decode()
 
 class JsonFormatter(logging.Formatter):
     """
     Custom JSON formatter for CloudWatch structured logging.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted prefix) of the last timestamp rendered
+        self._time_cache = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Format the record's creation time as ISO 8601 UTC with microseconds.
+
+        The date/time part only changes once a second, so it is cached and
+        only the fraction is formatted per record.
+        """
+        second, fraction = divmod(record.created, 1)
+        second = int(second)
+        cached_second, prefix = self._time_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._time_cache = (second, prefix)
+        return f"{prefix}.{int(fraction * 1_000_000):06d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": self.formatTime(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
+        exception = record.__dict__.get("exc_json")
         if record.exc_info:
-            log_data["exception"] = {
+            exception = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info)
+                # One string rather than a list of lines, so it is a single field downstream
+                "traceback": self.formatException(record.exc_info)
             }
+            # Keep only the rendered exception: the exception object pins the
+            # raising frames and their locals through __traceback__. exc_text
+            # is what stdlib formatters print, and exc_json lets this
+            # formatter render the record again.
+            record.exc_info = None
+            record.exc_text = exception["traceback"]
+            record.exc_json = exception
+        if exception:
+            log_data["exception"] = exception
+
+        # One dict lookup instead of hasattr() plus a second attribute access
+        extra_fields = record.__dict__.get("extra_fields")
+        if extra_fields:
+            log_data.update(extra_fields)
+
+        return _dumps(log_data)
+
+# Resolved once at import; LOG_LEVEL is fixed for the life of the Lambda environment.
+# An unknown level name falls back to INFO instead of failing the import.
+_LEVEL = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+
+# Field values that can't change after the log call, so they need no copy
+_IMMUTABLE_FIELD_TYPES = (str, int, float, bool, type(None))
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() renders the record with a plain Formatter and drops
+    exc_info, so only the %-style message is resolved here, while its args
+    can't change under us. The extra fields are snapshotted for the same
+    reason, deep-copied only when some value is a container. The JSON line
+    and traceback are built on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        extra_fields = record.__dict__.get("extra_fields")
+        if extra_fields:
+            fields = dict(extra_fields)
+            if not all(isinstance(value, _IMMUTABLE_FIELD_TYPES) for value in fields.values()):
+                fields = copy.deepcopy(fields)
+            record.extra_fields = fields
+        return record
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that lets the stream's buffer coalesce writes.
+
+    StreamHandler flushes after every record, which costs a write() syscall
+    per log line; here only ERROR and above are flushed right away, so crash
+    diagnostics still get out, and everything else goes out in 8 KiB chunks
+    or on flush_logs().
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+# Records are only enqueued on the caller's thread; a background listener
+# formats them and writes them to stderr
+_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+# Block-buffered text stream on stderr's file descriptor, left open at exit
+_STREAM = open(2, "w", buffering=8192, encoding="utf-8", closefd=False)
+
+_STREAM_HANDLER = _BufferedStreamHandler(_STREAM)
+_STREAM_HANDLER.setLevel(_LEVEL)
+_STREAM_HANDLER.setFormatter(JsonFormatter())
+
+_HANDLER = _QueueHandler(_QUEUE)
+_HANDLER.setLevel(_LEVEL)
 
-        if hasattr(record, "extra_fields"):
-            log_data.update(record.extra_fields)
+_LISTENER = logging.handlers.QueueListener(_QUEUE, _STREAM_HANDLER, respect_handler_level=True)
+_LISTENER.start()
 
-        return json.dumps(log_data)
+def _stop_logging() -> None:
+    """Write out the queue and the stream buffer at interpreter exit."""
+    _LISTENER.stop()
+    _STREAM_HANDLER.flush()
+
+atexit.register(_stop_logging)
+
+def flush_logs() -> None:
+    """
+    Write out every queued log record.
+
+    Call before the Lambda handler returns: the environment may be frozen
+    right after, with records still waiting on the listener thread.
+    """
+    # stop() drains the queue and joins the thread; start() brings up a new one
+    _LISTENER.stop()
+    _STREAM_HANDLER.flush()
+    _LISTENER.start()
 
 class StructuredLogger:
     """
-    Wrapper around Python logger that provides structured logging capabilities
+    Wrapper around Python logger that provides structured logging capabilities.
+    Positional args are passed through for lazy %-style message formatting.
     """
 
+    __slots__ = ("logger", "context", "_level")
+
     def __init__(self, name: str = "price-tracker-scraper", context: Optional[Dict[str, Any]] = None):
         self.logger = logging.getLogger(name)
         self.context = context or {}
 
         if not self.logger.handlers:
-            log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-            self.logger.setLevel(getattr(logging, log_level))
+            self.logger.setLevel(_LEVEL)
+            self.logger.addHandler(_HANDLER)
+            self.logger.propagate = False
 
-            handler = logging.StreamHandler()
-            handler.setLevel(getattr(logging, log_level))
-            handler.setFormatter(JsonFormatter())
+        # Cached like _LEVEL, so filtered-out calls return before building any fields
+        self._level = self.logger.getEffectiveLevel()
 
-            self.logger.addHandler(handler)
-            self.logger.propagate = False
+    def _add_context(self, extra: Dict[str, Any]) -> Mapping[str, Any]:
+        """
+        Merge logger context with extra fields.
+
+        extra is the call's own kwargs dict, so it is used as is; with a
+        context, a ChainMap layers the two without copying either.
+        """
+        if not self.context:
+            return extra
+        return ChainMap(extra, self.context)
 
-    def _add_context(self, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Merge logger context with extra fields."""
-        merged = self.context.copy()
-        if extra:
-            merged.update(extra)
-        return merged
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message at this level would be logged, before building its fields."""
+        return level >= self._level
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message with optional extra fields."""
+        if logging.INFO < self._level:
+            return
         extra_fields = self._add_context(kwargs)
-        self.logger.info(message, extra={"extra_fields": extra_fields})
+        self.logger.info(message, *args, extra={"extra_fields": extra_fields})
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error message with optional extra fields."""
+        if logging.ERROR < self._level:
+            return
         extra_fields = self._add_context(kwargs)
-        self.logger.error(message, extra={"extra_fields": extra_fields})
+        self.logger.error(message, *args, extra={"extra_fields": extra_fields})
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message with optional extra fields."""
+        if logging.WARNING < self._level:
+            return
         extra_fields = self._add_context(kwargs)
-        self.logger.warning(message, extra={"extra_fields": extra_fields})
+        self.logger.warning(message, *args, extra={"extra_fields": extra_fields})
 
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message with optional extra fields."""
+        if logging.DEBUG < self._level:
+            return
         extra_fields = self._add_context(kwargs)
-        self.logger.debug(message, extra={"extra_fields": extra_fields})
+        self.logger.debug(message, *args, extra={"extra_fields": extra_fields})
 
-    def exception(self, message: str, **kwargs):
+    def exception(self, message: str, *args, **kwargs):
         """Log exception with traceback and optional extra fields."""
+        if logging.ERROR < self._level:
+            return
         extra_fields = self._add_context(kwargs)
-        self.logger.exception(message, extra={"extra_fields": extra_fields})
+        self.logger.exception(message, *args, extra={"extra_fields": extra_fields})
 
 def get_logger(name: str = "price-tracker-scraper", lambda_context=None) -> StructuredLogger:
     """
@@ -96,60 +245,128 @@ def get_logger(name: str = "price-tracker-scraper", lambda_context=None) -> Stru
     Returns:
         Configured StructuredLogger instance
     """
-    context = {}
-
-    if lambda_context:
-        context = {
-            "request_id": lambda_context.aws_request_id,
-            "function_name": lambda_context.function_name,
-            "function_version": lambda_context.function_version,
-            "memory_limit_mb": lambda_context.memory_limit_in_mb,
-        }
+    if not lambda_context:
+        return _get_context_free_logger(name)
+
+    context = {
+        "request_id": lambda_context.aws_request_id,
+        "function_name": lambda_context.function_name,
+        "function_version": lambda_context.function_version,
+        "memory_limit_mb": lambda_context.memory_limit_in_mb,
+    }
 
     return StructuredLogger(name, context)
 
+@functools.lru_cache(maxsize=None)
+def _get_context_free_logger(name: str) -> StructuredLogger:
+    """Shared StructuredLogger per name for module-level get_logger() calls."""
+    return StructuredLogger(name)
+
+# Memory readings taken less than this many seconds apart reuse the last sample
+_MEMORY_SAMPLE_TTL = 0.1
+
+@functools.lru_cache(maxsize=None)
+def _scraping_metric_names(store: str) -> Tuple[str, ...]:
+    """Metric names for record_scraping_metrics(), built once per store."""
+    return (
+        f"{store}_products_processed",
+        f"{store}_success_count",
+        f"{store}_failure_count",
+        f"{store}_duration_seconds",
+        f"{store}_success_rate",
+    )
+
 class MetricsLogger:
     """
     Enhanced utility class for logging performance metrics with timing and memory tracking.
+
+    record(), increment(), log_metrics() and reset() are always available;
+    timers and memory readings can be switched off where they aren't wanted.
     """
 
-    def __init__(self, logger: StructuredLogger):
+    __slots__ = (
+        "logger",
+        "enable_timing",
+        "enable_memory",
+        "metrics",
+        "timers",
+        "counters",
+        "start_time",
+        "_process",
+        "_total_memory",
+        "_memory_sample",
+    )
+
+    def __init__(self, logger: StructuredLogger, enable_timing: bool = True, enable_memory: bool = True):
+        """
+        Initialize metrics logger.
+
+        Args:
+            logger: StructuredLogger the metrics are written to
+            enable_timing: Measure start_timer()/end_timer() durations
+            enable_memory: Add memory usage to log_metrics() (needs psutil)
+        """
         self.logger = logger
+        self.enable_timing = enable_timing
+        self.enable_memory = enable_memory
         self.metrics: Dict[str, Any] = {}
-        self.timers: Dict[str, float] = {}
-        self.counters: Dict[str, int] = {}
+        # Timer name -> time.perf_counter_ns() when it was started
+        self.timers: Dict[str, int] = {}
+        self.counters: DefaultDict[str, int] = defaultdict(int)
         self.start_time = time.time()
 
+        # psutil process handle and total memory, looked up on the first reading
+        self._process = None
+        self._total_memory = 0
+        # (time.monotonic(), rss in MB, percent of total memory) of the last reading
+        self._memory_sample = None
+
     def record(self, metric_name: str, value: Any) -> None:
         """Record a metric."""
         self.metrics[metric_name] = value
 
     def increment(self, metric_name: str, value: int = 1) -> None:
         """Increment a counter metric."""
-        self.counters[metric_name] = self.counters.get(metric_name, 0) + value
+        self.counters[metric_name] += value
     
     def start_timer(self, timer_name: str) -> None:
         """Start a timer for measuring duration."""
-        self.timers[f"{timer_name}_start"] = time.time()
+        if not self.enable_timing:
+            return
+        self.timers[timer_name] = time.perf_counter_ns()
     
     def end_timer(self, timer_name: str) -> float:
-        """End a timer and return the duration in seconds."""
-        if f"{timer_name}_start" not in self.timers:
-            self.logger.warning(f"Timer '{timer_name}' was not started")
+        """End a timer and return the duration in seconds (0.0 with timing disabled)."""
+        if not self.enable_timing:
             return 0.0
-        
-        start_time = self.timers[f"{timer_name}_start"]
-        duration = time.time() - start_time
+        start_ns = self.timers.pop(timer_name, None)
+        if start_ns is None:
+            self.logger.warning("Timer '%s' was not started", timer_name, timer=timer_name)
+            return 0.0
+
+        # Monotonic, so clock adjustments can't skew or negate the duration
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         self.record(f"{timer_name}_duration_seconds", duration)
         return duration
     
     def record_memory_usage(self) -> None:
         """Record current memory usage."""
         try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            self.record("memory_used_mb", memory_info.rss / 1024 / 1024)
-            self.record("memory_percent", process.memory_percent())
+            now = time.monotonic()
+            if self._memory_sample is None or now - self._memory_sample[0] >= _MEMORY_SAMPLE_TTL:
+                if self._process is None:
+                    # Imported here rather than at module level: psutil is
+                    # only needed for memory readings, not at cold start
+                    import psutil
+                    self._total_memory = psutil.virtual_memory().total
+                    self._process = psutil.Process()
+                rss = self._process.memory_info().rss
+                # Same figure as Process.memory_percent(), without a second memory_info()
+                self._memory_sample = (now, rss / 1024 / 1024, rss / self._total_memory * 100)
+
+            _, used_mb, percent = self._memory_sample
+            self.record("memory_used_mb", used_mb)
+            self.record("memory_percent", percent)
         except Exception as e:
             self.logger.warning("Could not record memory usage", error=str(e))
 
@@ -168,7 +385,8 @@ class MetricsLogger:
     def log_metrics(self) -> None:
         """Log all recorded metrics in structured format."""
         self.record_execution_metrics()
-        self.record_memory_usage()
+        if self.enable_memory:
+            self.record_memory_usage()
 
         # Combine all metrics
         all_metrics = {
@@ -182,21 +400,27 @@ class MetricsLogger:
         """Reset all metrics and timers."""
         self.metrics = {}
         self.timers = {}
-        self.counters = {}
+        self.counters = defaultdict(int)
         self.start_time = time.time()
     
     # Convenience methods for common metrics
     def record_scraping_metrics(self, store: str, products_processed: int, success_count: int, failure_count: int, duration: float) -> None:
         """Record scraping-specific metrics."""
-        self.record(f"{store}_products_processed", products_processed)
-        self.record(f"{store}_success_count", success_count)
-        self.record(f"{store}_failure_count", failure_count)
-        self.record(f"{store}_duration_seconds", duration)
-        self.record(f"{store}_success_rate", success_count / products_processed if products_processed > 0 else 0)
-        
-        self.increment("total_products_processed", products_processed)
-        self.increment("successful_operations", success_count)
-        self.increment("failed_operations", failure_count)
+        self.metrics.update(zip(_scraping_metric_names(store), (
+            products_processed,
+            success_count,
+            failure_count,
+            duration,
+            success_count / products_processed if products_processed > 0 else 0,
+        )))
+
+        counters = self.counters
+        for name, value in (
+            ("total_products_processed", products_processed),
+            ("successful_operations", success_count),
+            ("failed_operations", failure_count),
+        ):
+            counters[name] += value
 
     def record_database_metrics(self, operation: str, duration: float, success: bool) -> None:
         """Record database operation metrics."""